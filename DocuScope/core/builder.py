@@ -5,6 +5,7 @@ Build generation and validation module
 from itertools import combinations, product
 from typing import List, Dict, Any, Optional, Tuple
 import math
+import numpy as np
 from . import stats
 
 # Define item slots and their categories
@@ -21,6 +22,38 @@ CLASS_WEAPONS = {
     'shaman': ['relik']
 }
 
+# Stat keys summed across a build's items ('def' is listed twice, so it counts double)
+AGGREGATE_STAT_KEYS = [
+    'hp', 'hpBonus', 'mr', 'ms', 'sdPct', 'sdRaw', 'mdPct', 'mdRaw',
+    'ls', 'ref', 'thorns', 'exploding', 'spd', 'atkTier', 'poison',
+    'hpr', 'def', 'spPct1', 'spRaw1', 'spPct2', 'spRaw2', 'spPct3', 'spRaw3', 'spPct4', 'spRaw4',
+    'rainbowRaw', 'sprint', 'sprintReg', 'jh', 'lq', 'gXp', 'gSpd',
+    # Elemental damage
+    'eDamPct', 'tDamPct', 'wDamPct', 'fDamPct', 'aDamPct',
+    'eDefPct', 'tDefPct', 'wDefPct', 'fDefPct', 'aDefPct',
+    # Skill point bonuses
+    'str', 'dex', 'int', 'def', 'agi'
+]
+
+SKILL_POINT_STATS = ['str', 'dex', 'int', 'def', 'agi']
+
+# Column layout of the per-item vectors used by calculate_build_stats_batch:
+# raw stats, then skill point requirements, then estimated cost
+RAW_STAT_COLUMNS = list(dict.fromkeys(AGGREGATE_STAT_KEYS))
+BATCH_COLUMNS = RAW_STAT_COLUMNS + [f'{stat}Req' for stat in SKILL_POINT_STATS] + ['cost']
+BATCH_INDEX = {key: i for i, key in enumerate(BATCH_COLUMNS)}
+
+# Base emerald cost estimate per item tier
+TIER_COSTS = {
+    'Normal': 0,
+    'Unique': 1,
+    'Rare': 5,
+    'Legendary': 50,
+    'Mythic': 500,
+    'Fabled': 1000,
+    'Set': 20
+}
+
 def generate_builds(items: List[Dict[str, Any]], class_choice: str, playstyle: str, 
                    elements: List[str], filters: Dict[str, Any], max_builds: int = 1000) -> List[Dict[str, Any]]:
     """Generate all viable builds based on user constraints."""
@@ -252,22 +285,79 @@ def calculate_build_stats(build: Dict[str, Any]) -> Dict[str, float]:
     
     return build_stats
 
+def calculate_build_stats_batch(builds: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Calculate build statistics for many builds at once.
+    
+    Each distinct item is turned into one stat vector; the builds are stacked
+    into an (n_builds, n_slots, n_columns) array and totalled in a single
+    sum over the slot axis. Returns the same dicts as calculate_build_stats.
+    """
+    if not builds:
+        return []
+    
+    # One vector per distinct item (builds share most of their items)
+    vectors = {}
+    build_items = []
+    for build in builds:
+        items = [item for item in build.values() if isinstance(item, dict)]
+        for item in items:
+            if id(item) not in vectors:
+                vectors[id(item)] = item_stat_vector(item)
+        build_items.append(items)
+    
+    n_slots = max(len(items) for items in build_items)
+    stacked = np.zeros((len(builds), n_slots, len(BATCH_COLUMNS)), dtype=np.float64)
+    for b, items in enumerate(build_items):
+        for slot, item in enumerate(items):
+            stacked[b, slot] = vectors[id(item)]
+    
+    totals = stacked.sum(axis=1)
+    
+    n_raw = len(RAW_STAT_COLUMNS)
+    req_cols = [BATCH_INDEX[f'{stat}Req'] for stat in SKILL_POINT_STATS]
+    cost_col = BATCH_INDEX['cost']
+    
+    results = []
+    for build, row in zip(builds, totals):
+        raw_stats = dict(zip(RAW_STAT_COLUMNS, row[:n_raw].tolist()))
+        class_name = build.get('class', 'mage')
+        weapon = build.get('weapon', {})
+        
+        results.append({
+            'dps': stats.calculate_spell_damage(weapon, raw_stats, class_name) if weapon else 0.0,
+            'mana': stats.calculate_mana_sustain(raw_stats),
+            'ehp': stats.calculate_effective_hp(raw_stats, class_name),
+            'cost': float(row[cost_col]),
+            'skill_points': dict(zip(SKILL_POINT_STATS, row[req_cols].astype(np.int64).tolist())),
+            'raw_stats': raw_stats
+        })
+    
+    return results
+
+def item_stat_vector(item: Dict[str, Any]) -> np.ndarray:
+    """Build an item's BATCH_COLUMNS vector (its share of a build's totals)."""
+    vector = np.zeros(len(BATCH_COLUMNS), dtype=np.float64)
+    
+    for key in AGGREGATE_STAT_KEYS:
+        if key in item:
+            value = item[key]
+            if isinstance(value, (int, float)):
+                vector[BATCH_INDEX[key]] += value
+    
+    for stat in SKILL_POINT_STATS:
+        req_key = f'{stat}Req'
+        if req_key in item:
+            vector[BATCH_INDEX[req_key]] += item[req_key]
+    
+    vector[BATCH_INDEX['cost']] = item_cost(item)
+    
+    return vector
+
 def aggregate_item_stats(build: Dict[str, Any]) -> Dict[str, float]:
     """Aggregate stats from all items in build."""
     stats = {}
-    
-    # Define stat keys to aggregate
-    stat_keys = [
-        'hp', 'hpBonus', 'mr', 'ms', 'sdPct', 'sdRaw', 'mdPct', 'mdRaw',
-        'ls', 'ref', 'thorns', 'exploding', 'spd', 'atkTier', 'poison',
-        'hpr', 'def', 'spPct1', 'spRaw1', 'spPct2', 'spRaw2', 'spPct3', 'spRaw3', 'spPct4', 'spRaw4',
-        'rainbowRaw', 'sprint', 'sprintReg', 'jh', 'lq', 'gXp', 'gSpd',
-        # Elemental damage
-        'eDamPct', 'tDamPct', 'wDamPct', 'fDamPct', 'aDamPct',
-        'eDefPct', 'tDefPct', 'wDefPct', 'fDefPct', 'aDefPct',
-        # Skill point bonuses
-        'str', 'dex', 'int', 'def', 'agi'
-    ]
+    stat_keys = AGGREGATE_STAT_KEYS
     
     # Initialize all stats to 0
     for key in stat_keys:
@@ -288,29 +378,22 @@ def calculate_build_cost(build: Dict[str, Any]) -> float:
     """Estimate build cost based on item tiers and rarity."""
     cost = 0
     
-    tier_costs = {
-        'Normal': 0,
-        'Unique': 1,
-        'Rare': 5,
-        'Legendary': 50,
-        'Mythic': 500,
-        'Fabled': 1000,
-        'Set': 20
-    }
-    
     for item in build.values():
         if isinstance(item, dict):
-            tier = item.get('tier', 'Normal')
-            base_cost = tier_costs.get(tier, 0)
-            
-            # Adjust cost based on level
-            level = item.get('lvl', 1)
-            level_multiplier = max(1, level / 50)
-            
-            cost += base_cost * level_multiplier
+            cost += item_cost(item)
     
     return cost
 
+def item_cost(item: Dict[str, Any]) -> float:
+    """Estimate a single item's cost from its tier and level."""
+    base_cost = TIER_COSTS.get(item.get('tier', 'Normal'), 0)
+    
+    # Adjust cost based on level
+    level = item.get('lvl', 1)
+    level_multiplier = max(1, level / 50)
+    
+    return base_cost * level_multiplier
+
 def calculate_build_score(build: Dict[str, Any]) -> float:
     """Calculate a score for ranking builds."""
     stats = calculate_build_stats(build)
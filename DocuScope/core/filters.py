@@ -4,41 +4,134 @@ Advanced filtering system for items and builds
 
 from typing import List, Dict, Any, Optional, Callable
 import re
+import numpy as np
+
+# Numeric item stats read by the playstyle filters (columns of build_item_columns)
+PLAYSTYLE_STATS = [
+    'sdPct', 'sdRaw', 'mdPct', 'mdRaw', 'mr', 'ms', 'atkTier', 'ls', 'hp', 'hpBonus', 'hpr',
+    'str', 'dex', 'int', 'def', 'agi',
+    'eDamPct', 'tDamPct', 'wDamPct', 'fDamPct', 'aDamPct',
+    'eDefPct', 'tDefPct', 'wDefPct', 'fDefPct', 'aDefPct'
+]
+
+def build_item_columns(items: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Build a column store (one array per field, indexed like items) for filter_items.
+    
+    Build it once per loaded item list; filtering then works on whole columns
+    instead of looking fields up item by item.
+    """
+    columns = {
+        'classReq': np.array([(item.get('classReq') or '').lower() for item in items], dtype=object),
+        'tier': np.array([item.get('tier') for item in items], dtype=object),
+        'lvl': np.fromiter((item.get('lvl', 0) for item in items), dtype=np.int32, count=len(items))
+    }
+    for stat in PLAYSTYLE_STATS:
+        columns[stat] = np.fromiter((item.get(stat, 0) for item in items), dtype=np.float32, count=len(items))
+    return columns
 
 def filter_items(items: List[Dict[str, Any]], class_filter: Optional[str] = None,
                 playstyle_filter: Optional[str] = None, element_filter: Optional[List[str]] = None,
                 no_mythics: bool = False, level_range: Optional[tuple] = None,
-                custom_filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-    """Advanced item filtering with multiple criteria."""
+                custom_filters: Optional[Dict[str, Any]] = None,
+                columns: Optional[Dict[str, np.ndarray]] = None) -> List[Dict[str, Any]]:
+    """
+    Advanced item filtering with multiple criteria.
+    
+    Pass columns=build_item_columns(items) to run the class, mythic, level and
+    playstyle filters as array operations.
+    """
+    
+    if columns is not None:
+        indices = filter_item_columns(columns, class_filter, playstyle_filter, no_mythics, level_range)
+        filtered = [items[i] for i in indices]
+    else:
+        filtered = items.copy()
+        
+        # Class requirement filter
+        if class_filter:
+            filtered = apply_class_filter(filtered, class_filter)
+        
+        # Mythic filter
+        if no_mythics:
+            filtered = apply_tier_filter(filtered, exclude_tiers=['Mythic'])
+        
+        # Level range filter
+        if level_range:
+            min_level, max_level = level_range
+            filtered = apply_level_filter(filtered, min_level, max_level)
+        
+        # Playstyle filter
+        if playstyle_filter:
+            filtered = apply_playstyle_filter(filtered, playstyle_filter)
     
-    filtered = items.copy()
+    # Element filter
+    if element_filter:
+        filtered = apply_element_filter(filtered, element_filter)
+    
+    # Custom filters
+    if custom_filters:
+        filtered = apply_custom_filters(filtered, custom_filters)
+    
+    return filtered
+
+def filter_item_columns(columns: Dict[str, np.ndarray], class_filter: Optional[str] = None,
+                        playstyle_filter: Optional[str] = None, no_mythics: bool = False,
+                        level_range: Optional[tuple] = None) -> np.ndarray:
+    """Indices of the items passing the class/mythic/level/playstyle filters, in filter_items order."""
+    mask = np.ones(len(columns['lvl']), dtype=bool)
     
     # Class requirement filter
     if class_filter:
-        filtered = apply_class_filter(filtered, class_filter)
+        class_req = columns['classReq']
+        mask &= (class_req == '') | (class_req == class_filter.lower())
     
     # Mythic filter
     if no_mythics:
-        filtered = apply_tier_filter(filtered, exclude_tiers=['Mythic'])
+        mask &= columns['tier'] != 'Mythic'
     
     # Level range filter
     if level_range:
         min_level, max_level = level_range
-        filtered = apply_level_filter(filtered, min_level, max_level)
+        mask &= (columns['lvl'] >= min_level) & (columns['lvl'] <= max_level)
     
-    # Playstyle filter
+    indices = np.flatnonzero(mask)
+    
+    # Playstyle filter: same scores as filter_for_*, highest first (stable, like list.sort)
     if playstyle_filter:
-        filtered = apply_playstyle_filter(filtered, playstyle_filter)
+        scores = playstyle_scores(columns, playstyle_filter)
+        if scores is not None:
+            scores = scores[indices]
+            order = np.argsort(-scores, kind='stable')
+            indices, scores = indices[order], scores[order]
+            if playstyle_filter.lower() != 'hybrid':
+                indices = indices[scores >= 0]
+    
+    return indices
+
+def playstyle_scores(columns: Dict[str, np.ndarray], playstyle: str) -> Optional[np.ndarray]:
+    """Vectorized filter_for_<playstyle> item scores (None for an unknown playstyle)."""
+    playstyle = playstyle.lower()
     
-    # Element filter
-    if element_filter:
-        filtered = apply_element_filter(filtered, element_filter)
+    def has(stat):
+        return (columns[stat] > 0).astype(np.int32)
     
-    # Custom filters
-    if custom_filters:
-        filtered = apply_custom_filters(filtered, custom_filters)
+    if playstyle == 'spellspam':
+        return (3 * has('sdPct') + 2 * has('sdRaw') + 3 * has('mr') + 2 * has('ms') + 2 * has('int')
+                + sum(has(stat) for stat in ['eDamPct', 'tDamPct', 'wDamPct', 'fDamPct', 'aDamPct'])
+                - (columns['mdPct'] > 15))
+    elif playstyle == 'melee':
+        return (3 * has('mdPct') + 2 * has('mdRaw') + 2 * has('atkTier') + 2 * has('str') + 2 * has('dex')
+                + has('ls') + has('hp'))
+    elif playstyle == 'tank':
+        return (3 * has('hp') + 2 * has('hpBonus') + 3 * has('def') + 2 * has('hpr')
+                + sum(has(stat) for stat in ['eDefPct', 'tDefPct', 'wDefPct', 'fDefPct', 'aDefPct'])
+                - 2 * (columns['hp'] < 0) - 2 * (columns['def'] < 0))
+    elif playstyle == 'hybrid':
+        return (3 * (has('sdPct') & has('mdPct')) + has('hp') + has('mr')
+                + sum(has(stat) for stat in ['str', 'dex', 'int', 'def', 'agi']))
     
-    return filtered
+    return None
 
 def apply_class_filter(items: List[Dict[str, Any]], class_name: str) -> List[Dict[str, Any]]:
     """Filter items by class requirement."""
@@ -7,15 +7,25 @@ import os
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
-def load_items() -> Optional[Dict[str, Any]]:
-    """Load items from the items.json file."""
+# Possible items.json locations, in lookup order
+ITEMS_PATHS = [
+    Path("data/items.json"),
+    Path("../data/items.json"),
+    Path("items.json"),
+    Path(os.path.dirname(__file__)) / "../data/items.json"
+]
+
+def find_items_file() -> Optional[Path]:
+    """Return the first items.json location that exists, or None."""
+    for file_path in ITEMS_PATHS:
+        if file_path.exists():
+            return file_path
+    return None
+
+def load_items(path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Load items from the items.json file (path if given, else the first of ITEMS_PATHS that exists)."""
     # Try multiple possible locations
-    possible_paths = [
-        Path("data/items.json"),
-        Path("../data/items.json"),
-        Path("items.json"),
-        Path(os.path.dirname(__file__)) / "../data/items.json"
-    ]
+    possible_paths = [path] if path is not None else ITEMS_PATHS
     
     for file_path in possible_paths:
         if file_path.exists():
@@ -0,0 +1,11 @@
+"""
+gunicorn settings for the web interface (passed by web_interface._run_gunicorn)
+"""
+
+def post_worker_init(worker):
+    """Set up logging and load items.json in each worker, so /health and the first request see the items."""
+    import web_interface
+    
+    web_interface.setup_logging()
+    if web_interface.load_items_cache() is None:
+        worker.log.warning("Could not load items on startup")
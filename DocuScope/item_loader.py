@@ -3,12 +3,94 @@ Wynncraft item database loader with comprehensive data processing
 Loads items from WynnBuilder GitHub repository and processes all item types
 """
 
-import json
+import sys
+import orjson
 import requests
-from typing import Dict, List, Any, Optional
+import numpy as np
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from pathlib import Path
 import time
 
+try:
+    import zstandard as zstd
+except ImportError:  # Optional: fall back to an uncompressed JSON cache
+    zstd = None
+
+try:
+    import simdjson
+    # One parser for the process: it reuses its internal tape across parses
+    _PARSER = simdjson.Parser()
+except ImportError:  # Optional: orjson handles parsing on its own
+    _PARSER = None
+
+# Errors that mean "cache unusable" rather than a bug (json, orjson and
+# simdjson decode errors are all ValueErrors)
+_CACHE_ERRORS = (ValueError, FileNotFoundError) + ((zstd.ZstdError,) if zstd else ())
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes with the shared simdjson parser when available, else orjson"""
+    if _PARSER is not None:
+        # recursive=True materializes plain Python objects, so nothing keeps
+        # a view into the parser's tape once the next document is parsed
+        return _PARSER.parse(data, recursive=True)
+    return orjson.loads(data)
+
+# Fixed element layouts for the numeric damage/defense arrays
+DAMAGE_ELEMENTS = ('neutral', 'earth', 'thunder', 'water', 'fire', 'air')
+DEFENSE_ELEMENTS = ('earth', 'thunder', 'water', 'fire', 'air')
+DAM_ELEMENT_INDEX = {element: i for i, element in enumerate(DAMAGE_ELEMENTS)}
+DEF_ELEMENT_INDEX = {element: i for i, element in enumerate(DEFENSE_ELEMENTS)}
+
+# Attacks per second for each weapon attack speed
+ATTACK_SPEED_MULTIPLIERS = {
+    'Super Slow': 0.51,
+    'Very Slow': 0.83,
+    'Slow': 1.5,
+    'Normal': 2.05,
+    'Fast': 2.5,
+    'Very Fast': 3.1,
+    'Super Fast': 4.3
+}
+
+# Raw Wynncraft keys, in the same order as the element layouts above
+_DAM_KEYS = ('nDam', 'eDam', 'tDam', 'wDam', 'fDam', 'aDam')
+_DEF_KEYS = ('eDef', 'tDef', 'wDef', 'fDef', 'aDef')
+
+# Item type groups used to decide which extra fields an item gets
+_WEAPON_TYPES = frozenset(('wand', 'bow', 'spear', 'dagger', 'relik'))
+_ARMOR_TYPES = frozenset(('helmet', 'chestplate', 'leggings', 'boots'))
+
+# Shared copies of the small strings every item repeats (types, slots, categories, tiers, classes)
+_INTERNED = {value: sys.intern(value) for value in (
+    'wand', 'bow', 'spear', 'dagger', 'relik',
+    'helmet', 'chestplate', 'leggings', 'boots', 'ring', 'bracelet', 'necklace',
+    'weapon', 'armor', 'accessory', 'unknown',
+    'Normal', 'Unique', 'Rare', 'Legendary', 'Fabled', 'Mythic', 'Set',
+    'mage', 'archer', 'warrior', 'assassin', 'shaman'
+)}
+
+def _interned(value: str) -> str:
+    """Return the shared copy of a known small string (or the value itself)"""
+    return _INTERNED.get(value, value)
+
+# Source for each filter_items_by_criteria clause; the named values are bound at call time
+_FILTER_CLAUSES = {
+    'min_level': "i.get('lvl', 0) >= min_level",
+    'max_level': "i.get('lvl', 0) <= max_level",
+    'allowed_weapons': "(i.get('slot') != 'weapon' or i.get('type') in allowed_weapons)",
+    'slot': "i.get('slot') == slot",
+    'tiers': "i.get('tier') in tiers",
+    'search_term': "search_term in i.get('name', '').lower()",
+}
+
+@lru_cache(maxsize=128)
+def _compile_item_filter(names: Tuple[str, ...]) -> Callable[..., Callable[[Dict[str, Any]], bool]]:
+    """Compile a factory that binds criteria values and returns one fused item predicate"""
+    clauses = ' and '.join(_FILTER_CLAUSES[name] for name in names)
+    source = f"lambda {', '.join(names)}: lambda i: {clauses}"
+    return eval(compile(source, '<item filter>', 'eval'))
+
 class WynncraftItemLoader:
     """Loads and processes Wynncraft item data from authoritative sources"""
     
@@ -17,7 +99,22 @@ class WynncraftItemLoader:
         self.items_url = "https://raw.githubusercontent.com/wynnbuilder/wynnbuilder.github.io/HEAD/js/items.json"
         self.fallback_url = "https://api.wynncraft.com/v3/item/database"
         self.local_cache = Path("data/items_cache.json")
+        self.compressed_cache = self.local_cache.with_suffix('.json.zst')
+        self.items_file = Path("data/items.json")
         self.items = []
+        # Filesystem state memoized per loader: data/ is created once, and
+        # cache-file existence is stat'ed once and then tracked on write
+        self._dir_ready = False
+        self._exists_cache: Dict[Path, bool] = {}
+        # Column views of self.items (rebuilt by _build_columns) for vectorized filters/stats,
+        # and the item list they were built from
+        self._columns_items = None
+        self._defense_matrix = np.zeros((0, len(DEFENSE_ELEMENTS)), dtype=np.int16)
+        self._tier_names = np.array([], dtype=object)
+        self._tier_code = np.zeros(0, dtype=np.intp)
+        self._slot_names = np.array([], dtype=object)
+        self._slot_code = np.zeros(0, dtype=np.intp)
+        self._lvl = np.zeros(0, dtype=np.int16)
         
         # Item type mappings
         self.slot_mappings = {
@@ -57,7 +154,41 @@ class WynncraftItemLoader:
 
     def ensure_data_directory(self):
         """Create data directory if it doesn't exist"""
-        Path("data").mkdir(exist_ok=True)
+        if not self._dir_ready:
+            Path("data").mkdir(exist_ok=True)
+            self._dir_ready = True
+
+    def _exists(self, path: Path) -> bool:
+        """Memoized path.exists() for the loader's own data files"""
+        exists = self._exists_cache.get(path)
+        if exists is None:
+            exists = self._exists_cache[path] = path.exists()
+        return exists
+
+    def save_to_cache(self, data: List[Dict[str, Any]]):
+        """Write raw items as compact JSON, zstd-compressed when zstandard is installed"""
+        self.ensure_data_directory()
+        payload = orjson.dumps(data)
+        if zstd is not None:
+            self.compressed_cache.write_bytes(zstd.ZstdCompressor(level=1).compress(payload))
+            self._exists_cache[self.compressed_cache] = True
+        else:
+            self.local_cache.write_bytes(payload)
+            self._exists_cache[self.local_cache] = True
+
+    def read_cache(self) -> Optional[List[Dict[str, Any]]]:
+        """Read the compressed cache if present, else the plain JSON cache (None if neither exists)"""
+        try:
+            if zstd is not None and self._exists(self.compressed_cache):
+                data = self.compressed_cache.read_bytes()
+                return _loads(zstd.ZstdDecompressor().decompress(data))
+            if self._exists(self.local_cache):
+                return _loads(self.local_cache.read_bytes())
+        except FileNotFoundError:
+            # Removed behind our back: forget the memoized state and report it
+            self._exists_cache.clear()
+            raise
+        return None
 
     def fetch_items_from_source(self) -> List[Dict[str, Any]]:
         """Fetch items from multiple sources with fallbacks"""
@@ -67,17 +198,15 @@ class WynncraftItemLoader:
             response = requests.get(self.items_url, timeout=30)
             response.raise_for_status()
             
-            raw_data = response.json()
+            raw_data = _loads(response.content)
             print(f"Successfully fetched {len(raw_data)} items from WynnBuilder")
             
             # Save to cache
-            self.ensure_data_directory()
-            with open(self.local_cache, 'w') as f:
-                json.dump(raw_data, f, indent=2)
+            self.save_to_cache(raw_data)
                 
             return raw_data
             
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             print(f"WynnBuilder source failed: {e}")
             
         # Try fallback source
@@ -86,7 +215,7 @@ class WynncraftItemLoader:
             response = requests.get(self.fallback_url, timeout=30)
             response.raise_for_status()
             
-            raw_data = response.json()
+            raw_data = _loads(response.content)
             
             # Handle different API response formats
             if isinstance(raw_data, dict):
@@ -99,16 +228,14 @@ class WynncraftItemLoader:
             print(f"Successfully fetched {len(items)} items from fallback source")
             
             # Save to cache
-            self.ensure_data_directory()
-            with open(self.local_cache, 'w') as f:
-                json.dump(items, f, indent=2)
+            self.save_to_cache(items)
                 
             return items
             
         except requests.RequestException as e:
             print(f"Fallback source failed: {e}")
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             print(f"Fallback JSON parsing failed: {e}")
             
         # Load from cache as last resort
@@ -120,30 +247,27 @@ class WynncraftItemLoader:
     def load_from_cache(self) -> List[Dict[str, Any]]:
         """Load items from local cache or existing data files"""
         # First try to load from cache
-        if self.local_cache.exists():
-            try:
-                with open(self.local_cache, 'r') as f:
-                    data = json.load(f)
-                    if data:  # Only use cache if it has data
-                        print(f"Loaded {len(data)} items from cache")
-                        return data
-            except (json.JSONDecodeError, FileNotFoundError) as e:
-                print(f"Cache error: {e}")
+        try:
+            data = self.read_cache()
+            if data:  # Only use cache if it has data
+                print(f"Loaded {len(data)} items from cache")
+                return data
+        except _CACHE_ERRORS as e:
+            print(f"Cache error: {e}")
         
         # Try to load from existing items.json file
-        items_file = Path("data/items.json")
-        if items_file.exists():
+        items_file = self.items_file
+        if self._exists(items_file):
             try:
-                with open(items_file, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, dict) and 'items' in data:
-                        items = data['items']
-                        print(f"Loaded {len(items)} items from data/items.json")
-                        return items
-                    elif isinstance(data, list):
-                        print(f"Loaded {len(data)} items from data/items.json")
-                        return data
-            except (json.JSONDecodeError, FileNotFoundError) as e:
+                data = _loads(items_file.read_bytes())
+                if isinstance(data, dict) and 'items' in data:
+                    items = data['items']
+                    print(f"Loaded {len(items)} items from data/items.json")
+                    return items
+                elif isinstance(data, list):
+                    print(f"Loaded {len(data)} items from data/items.json")
+                    return data
+            except _CACHE_ERRORS as e:
                 print(f"Error loading items.json: {e}")
         
         # Fallback to sample data if no other source works
@@ -152,9 +276,7 @@ class WynncraftItemLoader:
         sample_items = create_sample_items()
         
         # Save sample data to cache
-        self.ensure_data_directory()
-        with open(self.local_cache, 'w') as f:
-            json.dump(sample_items, f, indent=2)
+        self.save_to_cache(sample_items)
         
         print(f"Generated {len(sample_items)} sample items")
         return sample_items
@@ -164,26 +286,28 @@ class WynncraftItemLoader:
         Normalize raw item data into consistent format
         Handles various data formats from different Wynncraft sources
         """
+        # Local alias for raw_item.get, used for every field lookup below
+        g = raw_item.get
         try:
             # Basic item information with fallbacks for different data formats
             item = {
-                'name': raw_item.get('name', ''),
-                'type': raw_item.get('type', '').lower(),
-                'tier': raw_item.get('tier', raw_item.get('rarity', 'Normal')),
-                'lvl': raw_item.get('lvl', raw_item.get('level', 0)),
-                'category': raw_item.get('category', ''),
-                'slot': self.get_item_slot(raw_item)
+                'name': g('name', ''),
+                'type': _interned(g('type', '').lower()),
+                'tier': _interned(g('tier') or g('rarity') or 'Normal'),
+                'lvl': g('lvl') or g('level') or 0,
+                'category': _interned(g('category', '')),
+                'slot': _interned(self.get_item_slot(raw_item))
             }
             
             # Skill point requirements (handle both formats)
             for stat in ['str', 'dex', 'int', 'def', 'agi']:
                 # Try direct stat names first, then requirement format
-                req_value = raw_item.get(stat, raw_item.get(f'{stat}Req', 0))
+                req_value = g(stat, g(f'{stat}Req', 0))
                 item[f'{stat}Req'] = req_value
                 
             # Health and mana
-            item['hp'] = raw_item.get('hp', 0)
-            item['mana'] = raw_item.get('mana', 0)
+            item['hp'] = g('hp', 0)
+            item['mana'] = g('mana', 0)
             
             # Process identifications/stats
             identifications = {}
@@ -224,7 +348,7 @@ class WynncraftItemLoader:
             
             # Add skill point bonuses as identifications
             for stat in ['str', 'dex', 'int', 'def', 'agi']:
-                bonus_value = raw_item.get(stat, 0)
+                bonus_value = g(stat, 0)
                 if bonus_value > 0:
                     identifications[stat] = bonus_value
                     
@@ -232,34 +356,39 @@ class WynncraftItemLoader:
                 item['identifications'] = identifications
             
             # Weapon damage processing
-            if item['category'] == 'weapon' or item['type'] in ['wand', 'bow', 'spear', 'dagger', 'relik']:
-                item['damage'] = self.process_weapon_damage(raw_item)
-                item['attack_speed'] = raw_item.get('atkSpd', 'Normal')
+            if item['category'] == 'weapon' or item['type'] in _WEAPON_TYPES:
+                damage = self.process_weapon_damage(raw_item)
+                attack_speed = g('atkSpd', 'Normal')
+                item['damage'] = damage
+                item['attack_speed'] = attack_speed
+                # Per-weapon main attack constants: DPS is their product
+                item['_avg_hit_damage'] = float(damage.sum(dtype=np.int32)) / 2
+                item['_aps'] = ATTACK_SPEED_MULTIPLIERS.get(attack_speed, 2.05)
                 item['slot'] = 'weapon'
             
             # Elemental defenses for armor
-            if item['category'] == 'armor' or item['type'] in ['helmet', 'chestplate', 'leggings', 'boots']:
+            if item['category'] == 'armor' or item['type'] in _ARMOR_TYPES:
                 item['defenses'] = self.process_elemental_defenses(raw_item)
             
             # Set information
-            if raw_item.get('set'):
+            if g('set'):
                 item['set_name'] = raw_item['set']
             
             # Class requirements
-            if raw_item.get('classReq'):
-                item['classReq'] = raw_item['classReq'].lower()
+            if g('classReq'):
+                item['classReq'] = _interned(raw_item['classReq'].lower())
             
             # Quest/drop requirements
-            if raw_item.get('quest'):
+            if g('quest'):
                 item['quest_req'] = raw_item['quest']
-            elif raw_item.get('drop') == 'never':
+            elif g('drop') == 'never':
                 item['quest_req'] = 'Untradeable'
                 item['untradeable'] = True
             
             return item
             
         except Exception as e:
-            print(f"Error normalizing item {raw_item.get('name', 'Unknown')}: {e}")
+            print(f"Error normalizing item {g('name', 'Unknown')}: {e}")
             return None
 
     def get_item_slot(self, raw_item: Dict[str, Any]) -> str:
@@ -315,95 +444,82 @@ class WynncraftItemLoader:
         
         return processed
 
-    def process_weapon_damage(self, raw_item: Dict[str, Any]) -> Dict[str, Any]:
-        """Process weapon damage values"""
-        damage = {
-            'neutral': [0, 0],
-            'earth': [0, 0],
-            'thunder': [0, 0], 
-            'water': [0, 0],
-            'fire': [0, 0],
-            'air': [0, 0]
-        }
-        
-        # Damage mappings
-        damage_keys = {
-            'nDam': 'neutral',
-            'eDam': 'earth', 
-            'tDam': 'thunder',
-            'wDam': 'water',
-            'fDam': 'fire',
-            'aDam': 'air'
-        }
+    def process_weapon_damage(self, raw_item: Dict[str, Any]) -> np.ndarray:
+        """
+        Process weapon damage values
+        Returns a (6, 2) int16 array of [min, max] rows ordered as DAMAGE_ELEMENTS
+        """
+        damage = np.zeros((len(_DAM_KEYS), 2), dtype=np.int16)
         
-        for raw_key, damage_type in damage_keys.items():
-            if raw_key in raw_item:
-                damage_str = raw_item[raw_key]
-                if isinstance(damage_str, str) and '-' in damage_str:
-                    try:
-                        min_dmg, max_dmg = map(int, damage_str.split('-'))
-                        damage[damage_type] = [min_dmg, max_dmg]
-                    except ValueError:
-                        pass
+        for i, raw_key in enumerate(_DAM_KEYS):
+            damage_str = raw_item.get(raw_key)
+            if isinstance(damage_str, str):
+                # "min-max" in one C-level partition; malformed ranges stay zero
+                min_dmg, sep, max_dmg = damage_str.partition('-')
+                if sep and min_dmg.isdigit() and max_dmg.isdigit():
+                    damage[i, 0] = int(min_dmg)
+                    damage[i, 1] = int(max_dmg)
         
         return damage
 
-    def process_elemental_defenses(self, raw_item: Dict[str, Any]) -> Dict[str, int]:
-        """Process elemental defense values"""
-        defenses = {
-            'earth': 0,
-            'thunder': 0,
-            'water': 0, 
-            'fire': 0,
-            'air': 0
-        }
-        
-        defense_keys = {
-            'eDef': 'earth',
-            'tDef': 'thunder',
-            'wDef': 'water',
-            'fDef': 'fire', 
-            'aDef': 'air'
-        }
+    def process_elemental_defenses(self, raw_item: Dict[str, Any]) -> np.ndarray:
+        """
+        Process elemental defense values
+        Returns a (5,) int16 array ordered as DEFENSE_ELEMENTS
+        """
+        defenses = np.zeros(len(_DEF_KEYS), dtype=np.int16)
         
-        for raw_key, defense_type in defense_keys.items():
+        for i, raw_key in enumerate(_DEF_KEYS):
             if raw_key in raw_item:
-                defenses[defense_type] = raw_item[raw_key]
+                defenses[i] = raw_item[raw_key]
         
         return defenses
 
+    def build_defense_matrix(self, items: List[Dict[str, Any]]) -> np.ndarray:
+        """Stack per-item defense arrays into an (N, 5) matrix (zeros for non-armor)"""
+        matrix = np.zeros((len(items), len(DEFENSE_ELEMENTS)), dtype=np.int16)
+        for row, item in enumerate(items):
+            defenses = item.get('defenses')
+            if defenses is not None:
+                matrix[row] = defenses
+        return matrix
+
     def filter_items_by_criteria(self, items: List[Dict[str, Any]], **criteria) -> List[Dict[str, Any]]:
         """Filter items by various criteria"""
         filtered = items
         
-        # Filter by level range
+        # Filter by minimum elemental defenses, e.g. min_defense={'fire': 50}
+        if 'min_defense' in criteria:
+            if items is self.items:
+                self._build_columns(items)
+                matrix = self._defense_matrix
+            else:
+                matrix = self.build_defense_matrix(items)
+            mask = np.ones(len(items), dtype=bool)
+            for element, threshold in criteria['min_defense'].items():
+                mask &= matrix[:, DEF_ELEMENT_INDEX[element]] >= threshold
+            filtered = [item for item, keep in zip(items, mask) if keep]
+        
+        # Collect the remaining criteria, then apply them in a single pass
+        bound = {}
         if 'min_level' in criteria:
-            filtered = [item for item in filtered if item.get('lvl', 0) >= criteria['min_level']]
+            bound['min_level'] = criteria['min_level']
         if 'max_level' in criteria:
-            filtered = [item for item in filtered if item.get('lvl', 0) <= criteria['max_level']]
-            
-        # Filter by class
+            bound['max_level'] = criteria['max_level']
         if 'player_class' in criteria:
             player_class = criteria['player_class'].lower()
             if player_class in self.class_weapons:
-                allowed_weapons = self.class_weapons[player_class]
-                filtered = [item for item in filtered 
-                           if item.get('slot') != 'weapon' or item.get('type') in allowed_weapons]
-        
-        # Filter by slot
+                bound['allowed_weapons'] = self.class_weapons[player_class]
         if 'slot' in criteria:
-            filtered = [item for item in filtered if item.get('slot') == criteria['slot']]
-        
-        # Filter by tier
+            bound['slot'] = criteria['slot']
         if 'tier' in criteria:
-            tiers = criteria['tier'] if isinstance(criteria['tier'], list) else [criteria['tier']]
-            filtered = [item for item in filtered if item.get('tier') in tiers]
-        
-        # Filter by name search
+            bound['tiers'] = criteria['tier'] if isinstance(criteria['tier'], list) else [criteria['tier']]
         if 'name_search' in criteria:
-            search_term = criteria['name_search'].lower()
-            filtered = [item for item in filtered 
-                       if search_term in item.get('name', '').lower()]
+            bound['search_term'] = criteria['name_search'].lower()
+        
+        if bound:
+            predicate = _compile_item_filter(tuple(bound))(*bound.values())
+            filtered = [item for item in filtered if predicate(item)]
         
         return filtered
 
@@ -461,8 +577,22 @@ class WynncraftItemLoader:
         normalized_items.sort(key=lambda x: (x.get('lvl', 0), x.get('name', '')))
         
         self.items = normalized_items
+        self._build_columns(normalized_items)
         return normalized_items
 
+    def _build_columns(self, items: List[Dict[str, Any]]):
+        """Build the per-item numeric columns used by filters and get_statistics (no-op if current)"""
+        # self.items may be reassigned after load_items; the columns follow the list identity
+        if items is self._columns_items:
+            return
+        self._columns_items = items
+        self._defense_matrix = self.build_defense_matrix(items)
+        self._tier_names, self._tier_code = np.unique(
+            np.array([item.get('tier', 'Normal') for item in items], dtype=object), return_inverse=True)
+        self._slot_names, self._slot_code = np.unique(
+            np.array([item.get('slot', 'unknown') for item in items], dtype=object), return_inverse=True)
+        self._lvl = np.fromiter((item.get('lvl', 0) for item in items), dtype=np.int16, count=len(items))
+
     def get_item_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Find item by exact name match"""
         for item in self.items:
@@ -497,24 +627,21 @@ class WynncraftItemLoader:
             'level_range': [0, 0]
         }
         
-        # Count by tier
-        for item in self.items:
-            tier = item.get('tier', 'Normal')
-            stats['by_tier'][tier] = stats['by_tier'].get(tier, 0) + 1
+        self._build_columns(self.items)
         
-        # Count by slot
-        for item in self.items:
-            slot = item.get('slot', 'unknown')
-            stats['by_slot'][slot] = stats['by_slot'].get(slot, 0) + 1
+        # Count by tier and slot
+        tier_counts = np.bincount(self._tier_code, minlength=len(self._tier_names))
+        stats['by_tier'] = dict(zip(self._tier_names.tolist(), tier_counts.tolist()))
+        slot_counts = np.bincount(self._slot_code, minlength=len(self._slot_names))
+        stats['by_slot'] = dict(zip(self._slot_names.tolist(), slot_counts.tolist()))
         
         # Level statistics
-        levels = [item.get('lvl', 0) for item in self.items if item.get('lvl', 0) > 0]
-        if levels:
-            stats['level_range'] = [min(levels), max(levels)]
+        levels = self._lvl[self._lvl > 0]
+        if levels.size:
+            stats['level_range'] = [int(levels.min()), int(levels.max())]
             
             # Count by level ranges
-            for level in levels:
-                range_key = f"{(level // 10) * 10}-{(level // 10) * 10 + 9}"
-                stats['by_level'][range_key] = stats['by_level'].get(range_key, 0) + 1
+            buckets, counts = np.unique((levels // 10) * 10, return_counts=True)
+            stats['by_level'] = {f"{b}-{b + 9}": int(n) for b, n in zip(buckets.tolist(), counts)}
         
         return stats
\ No newline at end of file
@@ -6,7 +6,7 @@ Main entry point for the application
 
 import sys
 import os
-import json
+import orjson
 import requests
 from pathlib import Path
 from rich.console import Console
@@ -52,11 +52,10 @@ def download_item_data():
                 response.raise_for_status()
                 
                 # Parse and validate JSON
-                data = response.json()
+                data = orjson.loads(response.content)
                 
-                # Save to file
-                with open(items_file, 'w') as f:
-                    json.dump(data, f, indent=2)
+                # Save to file (compact bytes)
+                items_file.write_bytes(orjson.dumps(data))
                 
                 progress.update(task, completed=True)
                 
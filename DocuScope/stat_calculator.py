@@ -3,126 +3,242 @@ Comprehensive Wynncraft build statistics calculator
 Implements authentic game formulas for damage, EHP, mana, and other combat stats
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, Union
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
 import math
+import numpy as np
+from item_loader import DEFENSE_ELEMENTS, ATTACK_SPEED_MULTIPLIERS
+
+SKILL_POINT_KEYS = ('str', 'dex', 'int', 'def', 'agi')
+UTILITY_STAT_KEYS = (
+    'walk_speed', 'mana_steal', 'life_steal', 'xp_bonus', 'loot_bonus',
+    'reflection', 'thorns', 'poison', 'exploding'
+)
+# Identification keys summed across the build
+ID_STAT_KEYS = (
+    'health_bonus', 'health_regen_raw', 'health_regen_percent', 'mana_regen',
+    'spell_damage_raw', 'spell_damage_percent', 'melee_damage_raw', 'melee_damage_percent',
+    'spell_cost_raw', 'spell_cost_percent'
+) + SKILL_POINT_KEYS
+
+class ClassId(IntEnum):
+    """Integer class ids, used to index CLASS_STATS"""
+    MAGE = 0
+    ARCHER = 1
+    WARRIOR = 2
+    ASSASSIN = 3
+    SHAMAN = 4
+
+# Lower-case class name -> ClassId
+CLASS_IDS = {class_id.name.lower(): class_id for class_id in ClassId}
+
+SPELL_KEYS = ('spell1', 'spell2', 'spell3', 'spell4')
+
+@dataclass(frozen=True)
+class ClassStats:
+    """Per-level base stats and base spell costs of a class"""
+    health: int
+    mana: int
+    defense_mult: float
+    spell_costs: np.ndarray  # Base mana cost of spell1..spell4
+
+# Class base stats (from reference materials), indexed by ClassId
+CLASS_STATS: List[ClassStats] = [
+    # Mage: takes 20% more damage than assassin
+    # Heal, Teleport, Meteor, Ice Snake
+    ClassStats(health=5, mana=20, defense_mult=0.8, spell_costs=np.array([6, 8, 4, 4], dtype=np.int32)),
+    # Archer: takes 40% more damage than assassin
+    # Arrow Storm, Escape, Bomb Arrow, Arrow Shield
+    ClassStats(health=5, mana=15, defense_mult=0.6, spell_costs=np.array([6, 8, 4, 6], dtype=np.int32)),
+    # Warrior: takes 20% less damage than assassin
+    # Bash, Charge, Uppercut, War Scream
+    ClassStats(health=5, mana=10, defense_mult=1.2, spell_costs=np.array([4, 6, 4, 8], dtype=np.int32)),
+    # Assassin: base reference (100%)
+    # Spin Attack, Vanish, Multihit, Smoke Bomb
+    ClassStats(health=5, mana=10, defense_mult=1.0, spell_costs=np.array([4, 6, 4, 8], dtype=np.int32)),
+    # Shaman: takes 50% more damage than assassin
+    # Totem, Haul, Aura, Uproot
+    ClassStats(health=5, mana=15, defense_mult=0.5, spell_costs=np.array([6, 4, 6, 8], dtype=np.int32)),
+]
+
+# Element type of stat vectors and of the batch scoring math
+STAT_DTYPE = np.float32
+
+PLAYSTYLES = ('spellspam', 'melee', 'tank', 'balanced')
+PLAYSTYLE_IDS = {name: i for i, name in enumerate(PLAYSTYLES)}
+
+# Score weights per playstyle (rows follow PLAYSTYLES); columns weight the
+# (damage, health, mana, survivability) component scores
+PLAYSTYLE_WEIGHTS = np.array([
+    [0.25, 0.25, 0.3, 0.1],   # spellspam
+    [0.25, 0.25, 0.25, 0.3],  # melee
+    [0.25, 0.2, 0.25, 0.6],   # tank
+    [0.3, 0.25, 0.2, 0.3],    # balanced
+], dtype=STAT_DTYPE)
+
+def playstyle_id(playstyle: str) -> int:
+    """Row of PLAYSTYLE_WEIGHTS for a playstyle (anything unknown, e.g. hybrid, scores as balanced)"""
+    return PLAYSTYLE_IDS.get(playstyle, PLAYSTYLE_IDS['balanced'])
+
+# Equipped items: a build dict keyed by slot ('weapon', 'helmet', ..., 'ring1', 'ring2', ...)
+# as the UI builds them, or a plain list of items
+Items = Union[Dict[str, Optional[Dict[str, Any]]], List[Dict[str, Any]]]
+
+# Column layout of an item's stat vector: base hp/mana, identifications,
+# utility identifications, elemental defenses, then the weapon's main attack DPS
+DEFENSE_STAT_KEYS = tuple(f'{element}_defense' for element in DEFENSE_ELEMENTS)
+STAT_KEYS = ('hp', 'mana') + ID_STAT_KEYS + UTILITY_STAT_KEYS + DEFENSE_STAT_KEYS + ('main_attack_dps',)
+KEY_INDEX = {key: i for i, key in enumerate(STAT_KEYS)}
+_DEFENSE_COLS = [KEY_INDEX[key] for key in DEFENSE_STAT_KEYS]
+
+# Stat vectors of registered catalog items, one row per item (see register_item).
+# Row EMPTY_ROW stays all zeros and stands in for empty slots; rows past the
+# registered count are zero-filled spare capacity.
+EMPTY_ROW = 0
+ITEM_STAT_TABLE = np.zeros((1, len(STAT_KEYS)), dtype=STAT_DTYPE)
+_ITEM_ROWS: Dict[str, int] = {}
+
+# Slot order of the per-build row index arrays used by calculate_build_scores_batch
+BUILD_SLOTS = ('weapon', 'helmet', 'chestplate', 'leggings', 'boots', 'ring1', 'ring2', 'bracelet', 'necklace')
+
+def main_attack_dps(weapon: Dict[str, Any]) -> float:
+    """Main attack DPS of a weapon: average damage per hit times attacks per second"""
+    avg_hit_damage = weapon.get('_avg_hit_damage')
+    if avg_hit_damage is not None:
+        return avg_hit_damage * weapon['_aps']
+    
+    # Weapon not normalized by WynncraftItemLoader: derive both from its damage array
+    weapon_damage = weapon.get('damage')
+    if weapon_damage is None or len(weapon_damage) == 0:
+        return 0.0
+    
+    # Each (min, max) row contributes (min + max) / 2
+    avg_hit_damage = float(weapon_damage.sum(dtype=np.int32)) / 2
+    return avg_hit_damage * ATTACK_SPEED_MULTIPLIERS.get(weapon.get('attack_speed', 'Normal'), 2.05)
+
+def item_stat_vector(item: Dict[str, Any]) -> np.ndarray:
+    """Build an item's stat vector (STAT_DTYPE, laid out as STAT_KEYS)"""
+    row = np.zeros(len(STAT_KEYS), dtype=STAT_DTYPE)
+    row[KEY_INDEX['hp']] = item.get('hp', 0)
+    row[KEY_INDEX['mana']] = item.get('mana', 0)
+    
+    ids = item.get('identifications', {})
+    for key in ID_STAT_KEYS + UTILITY_STAT_KEYS:
+        row[KEY_INDEX[key]] = ids.get(key, 0)
+    
+    item_defenses = item.get('defenses')
+    if item_defenses is not None:
+        row[_DEFENSE_COLS] = item_defenses
+    
+    if item.get('damage') is not None:
+        row[KEY_INDEX['main_attack_dps']] = main_attack_dps(item)
+    
+    return row
+
+def register_item(item: Dict[str, Any]) -> int:
+    """
+    Add a catalog item to ITEM_STAT_TABLE once and return its row index
+    
+    Items are keyed by name and treated as immutable: registering the same
+    name again returns the existing row.
+    """
+    global ITEM_STAT_TABLE
+    name = item['name']
+    row = _ITEM_ROWS.get(name)
+    if row is None:
+        row = len(_ITEM_ROWS) + 1  # After EMPTY_ROW
+        if row == len(ITEM_STAT_TABLE):
+            grown = np.zeros((max(64, 2 * row), len(STAT_KEYS)), dtype=STAT_DTYPE)
+            grown[:row] = ITEM_STAT_TABLE
+            ITEM_STAT_TABLE = grown
+        ITEM_STAT_TABLE[row] = item_stat_vector(item)
+        _ITEM_ROWS[name] = row
+    return row
+
+def build_rows(build: Dict[str, Optional[Dict[str, Any]]]) -> List[int]:
+    """ITEM_STAT_TABLE rows of a slot-keyed build in BUILD_SLOTS order (EMPTY_ROW for empty slots)"""
+    rows = []
+    for slot in BUILD_SLOTS:
+        item = build.get(slot)
+        rows.append(register_item(item) if item else EMPTY_ROW)
+    return rows
+
+@lru_cache(maxsize=None)
+def _load_score_kernel() -> Optional[Callable[..., float]]:
+    """Import the Numba score kernel on first use (None when numba is not installed)"""
+    try:
+        from stat_calculator_numba import score_build
+    except ImportError:
+        return None
+    return score_build
 
 class WynncraftStatsCalculator:
     """Calculates authentic Wynncraft build statistics"""
     
     def __init__(self):
-        # Base class stats (from reference materials)
-        self.class_base_stats = {
-            'mage': {
-                'health': 5,
-                'mana': 20,
-                'base_defense_multiplier': 0.8,  # Takes 20% more damage than assassin
-                'spell_cost_base': {
-                    'spell1': 6,  # Heal
-                    'spell2': 8,  # Teleport  
-                    'spell3': 4,  # Meteor
-                    'spell4': 4   # Ice Snake
-                }
-            },
-            'archer': {
-                'health': 5,
-                'mana': 15,
-                'base_defense_multiplier': 0.6,  # Takes 40% more damage than assassin
-                'spell_cost_base': {
-                    'spell1': 6,  # Arrow Storm
-                    'spell2': 8,  # Escape
-                    'spell3': 4,  # Bomb Arrow
-                    'spell4': 6   # Arrow Shield
-                }
-            },
-            'warrior': {
-                'health': 5,
-                'mana': 10,
-                'base_defense_multiplier': 1.2,  # Takes 20% less damage than assassin
-                'spell_cost_base': {
-                    'spell1': 4,  # Bash
-                    'spell2': 6,  # Charge
-                    'spell3': 4,  # Uppercut
-                    'spell4': 8   # War Scream
-                }
-            },
-            'assassin': {
-                'health': 5,
-                'mana': 10,
-                'base_defense_multiplier': 1.0,  # Base reference (100%)
-                'spell_cost_base': {
-                    'spell1': 4,  # Spin Attack
-                    'spell2': 6,  # Vanish
-                    'spell3': 4,  # Multihit
-                    'spell4': 8   # Smoke Bomb
-                }
-            },
-            'shaman': {
-                'health': 5,
-                'mana': 15,
-                'base_defense_multiplier': 0.5,  # Takes 50% more damage than assassin
-                'spell_cost_base': {
-                    'spell1': 6,  # Totem
-                    'spell2': 4,  # Haul
-                    'spell3': 6,  # Aura
-                    'spell4': 8   # Uproot
-                }
-            }
-        }
-        
         # Attack speed multipliers
-        self.attack_speed_multipliers = {
-            'Super Slow': 0.51,
-            'Very Slow': 0.83,
-            'Slow': 1.5,
-            'Normal': 2.05,
-            'Fast': 2.5,
-            'Very Fast': 3.1,
-            'Super Fast': 4.3
-        }
+        self.attack_speed_multipliers = ATTACK_SPEED_MULTIPLIERS
 
-    def calculate_build_stats(self, items: List[Dict[str, Any]], player_class: str, player_level: int = 106) -> Dict[str, Any]:
+    def calculate_build_stats(self, items: Items, player_class: str, player_level: int = 106,
+                              rows: Optional[List[int]] = None) -> Dict[str, Any]:
         """
         Calculate comprehensive build statistics
         
         Args:
-            items: List of equipped items
+            items: Equipped items, by slot (preferred) or as a list
             player_class: Player's class
             player_level: Player's level
+            rows: ITEM_STAT_TABLE rows of the items (from register_item); when
+                omitted the items are vectorized on the fly
             
         Returns:
             Dictionary with all calculated statistics
         """
+        matrix = ITEM_STAT_TABLE[rows] if rows is not None else self._vectorize_items(items)
+        totals = self._aggregate_identifications(matrix)
+        class_id = CLASS_IDS[player_class]
+        
+        health_stats = self._calculate_health(totals, class_id, player_level)
+        skill_points = self._calculate_skill_points(totals)
+        
         stats = {
             'level': player_level,
             'class': player_class,
-            'health': self._calculate_health(items, player_class, player_level),
-            'mana': self._calculate_mana(items, player_class, player_level),
-            'skill_points': self._calculate_skill_points(items),
-            'damage': self._calculate_damage_stats(items, player_class),
-            'defenses': self._calculate_defenses(items, player_class),
-            'utility_stats': self._calculate_utility_stats(items),
-            'spell_costs': self._calculate_spell_costs(items, player_class),
-            'effective_hp': self._calculate_effective_hp(items, player_class, player_level)
+            'health': health_stats,
+            'mana': self._calculate_mana(totals, class_id, player_level),
+            'skill_points': skill_points,
+            'damage': self._calculate_damage_stats(items, totals),
+            'defenses': self._calculate_defenses(totals),
+            'utility_stats': self._calculate_utility_stats(totals),
+            'spell_costs': self._calculate_spell_costs(totals, class_id),
+            'effective_hp': self._calculate_effective_hp(totals, class_id, player_level,
+                                                         health_stats=health_stats, skill_points=skill_points)
         }
         
         return stats
 
-    def _calculate_health(self, items: List[Dict[str, Any]], player_class: str, player_level: int) -> Dict[str, int]:
+    def _vectorize_items(self, items: Items) -> np.ndarray:
+        """Stack the equipped items' stat vectors into an (n_items, n_stat_keys) matrix"""
+        if isinstance(items, dict):
+            items = [item for item in items.values() if item]
+        if not items:
+            return np.zeros((0, len(STAT_KEYS)), dtype=STAT_DTYPE)
+        return np.stack([item_stat_vector(item) for item in items])
+
+    def _aggregate_identifications(self, matrix: np.ndarray) -> Dict[str, int]:
+        """Total every stat column in one pass (STAT_KEYS -> build total)"""
+        return dict(zip(STAT_KEYS, matrix.sum(axis=0).astype(np.int64).tolist()))
+
+    def _calculate_health(self, totals: Dict[str, int], class_id: ClassId, player_level: int) -> Dict[str, int]:
         """Calculate total health and health regeneration"""
-        base_health = self.class_base_stats[player_class]['health'] * player_level
+        base_health = CLASS_STATS[class_id].health * player_level
         
         # Sum health bonuses from items
-        health_bonus = 0
-        health_regen_raw = 0
-        health_regen_percent = 0
-        
-        for item in items:
-            health_bonus += item.get('hp', 0)
-            
-            ids = item.get('identifications', {})
-            health_bonus += ids.get('health_bonus', 0)
-            health_regen_raw += ids.get('health_regen_raw', 0)
-            health_regen_percent += ids.get('health_regen_percent', 0)
+        health_bonus = totals['hp'] + totals['health_bonus']
+        health_regen_raw = totals['health_regen_raw']
+        health_regen_percent = totals['health_regen_percent']
         
         total_health = base_health + health_bonus
         
@@ -138,19 +254,13 @@ class WynncraftStatsCalculator:
             'regen_per_5s': max(0, int(final_regen))
         }
 
-    def _calculate_mana(self, items: List[Dict[str, Any]], player_class: str, player_level: int) -> Dict[str, int]:
+    def _calculate_mana(self, totals: Dict[str, int], class_id: ClassId, player_level: int) -> Dict[str, int]:
         """Calculate total mana and mana regeneration"""
-        base_mana = self.class_base_stats[player_class]['mana'] * player_level
+        base_mana = CLASS_STATS[class_id].mana * player_level
         
         # Sum mana bonuses from items
-        mana_bonus = 0
-        mana_regen = 0
-        
-        for item in items:
-            mana_bonus += item.get('mana', 0)
-            
-            ids = item.get('identifications', {})
-            mana_regen += ids.get('mana_regen', 0)
+        mana_bonus = totals['mana']
+        mana_regen = totals['mana_regen']
         
         total_mana = base_mana + mana_bonus
         
@@ -161,24 +271,11 @@ class WynncraftStatsCalculator:
             'regen_per_5s': mana_regen
         }
 
-    def _calculate_skill_points(self, items: List[Dict[str, Any]]) -> Dict[str, int]:
+    def _calculate_skill_points(self, totals: Dict[str, int]) -> Dict[str, int]:
         """Calculate skill point bonuses from items"""
-        skill_points = {
-            'str': 0,
-            'dex': 0,
-            'int': 0,
-            'def': 0,
-            'agi': 0
-        }
-        
-        for item in items:
-            ids = item.get('identifications', {})
-            for stat in skill_points.keys():
-                skill_points[stat] += ids.get(stat, 0)
-        
-        return skill_points
+        return {key: totals[key] for key in SKILL_POINT_KEYS}
 
-    def _calculate_damage_stats(self, items: List[Dict[str, Any]], player_class: str) -> Dict[str, Any]:
+    def _calculate_damage_stats(self, items: Items, totals: Dict[str, int]) -> Dict[str, Any]:
         """Calculate damage statistics including spell and melee damage"""
         weapon = self._get_weapon(items)
         
@@ -191,117 +288,66 @@ class WynncraftStatsCalculator:
             }
         
         # Base weapon damage
-        weapon_damage = weapon.get('damage', {})
+        weapon_damage = weapon.get('damage')
         attack_speed = weapon.get('attack_speed', 'Normal')
         
-        # Calculate damage bonuses from all items
-        spell_damage_raw = 0
-        spell_damage_percent = 0
-        melee_damage_raw = 0
-        melee_damage_percent = 0
-        
-        for item in items:
-            ids = item.get('identifications', {})
-            spell_damage_raw += ids.get('spell_damage_raw', 0)
-            spell_damage_percent += ids.get('spell_damage_percent', 0)
-            melee_damage_raw += ids.get('melee_damage_raw', 0)
-            melee_damage_percent += ids.get('melee_damage_percent', 0)
-        
         # Calculate main attack DPS
-        main_attack_dps = self._calculate_main_attack_dps(weapon_damage, attack_speed)
+        main_attack_dps = self._calculate_main_attack_dps(weapon)
         
         return {
             'weapon_damage': weapon_damage,
             'attack_speed': attack_speed,
-            'spell_damage_raw': spell_damage_raw,
-            'spell_damage_percent': spell_damage_percent,
-            'melee_damage_raw': melee_damage_raw,
-            'melee_damage_percent': melee_damage_percent,
+            'spell_damage_raw': totals['spell_damage_raw'],
+            'spell_damage_percent': totals['spell_damage_percent'],
+            'melee_damage_raw': totals['melee_damage_raw'],
+            'melee_damage_percent': totals['melee_damage_percent'],
             'main_attack_dps': main_attack_dps
         }
 
-    def _calculate_defenses(self, items: List[Dict[str, Any]], player_class: str) -> Dict[str, int]:
+    def _calculate_defenses(self, totals: Dict[str, int]) -> Dict[str, int]:
         """Calculate elemental defenses"""
-        defenses = {
-            'earth': 0,
-            'thunder': 0,
-            'water': 0,
-            'fire': 0,
-            'air': 0
-        }
-        
-        for item in items:
-            item_defenses = item.get('defenses', {})
-            for element in defenses.keys():
-                defenses[element] += item_defenses.get(element, 0)
-        
-        return defenses
+        return {element: totals[key] for element, key in zip(DEFENSE_ELEMENTS, DEFENSE_STAT_KEYS)}
 
-    def _calculate_utility_stats(self, items: List[Dict[str, Any]]) -> Dict[str, float]:
+    def _calculate_utility_stats(self, totals: Dict[str, int]) -> Dict[str, float]:
         """Calculate utility statistics"""
-        utility = {
-            'walk_speed': 0,
-            'mana_steal': 0,
-            'life_steal': 0,
-            'xp_bonus': 0,
-            'loot_bonus': 0,
-            'reflection': 0,
-            'thorns': 0,
-            'poison': 0,
-            'exploding': 0
-        }
-        
-        for item in items:
-            ids = item.get('identifications', {})
-            for stat in utility.keys():
-                utility[stat] += ids.get(stat, 0)
-        
-        return utility
+        return {key: totals[key] for key in UTILITY_STAT_KEYS}
 
-    def _calculate_spell_costs(self, items: List[Dict[str, Any]], player_class: str) -> Dict[str, int]:
+    def _calculate_spell_costs(self, totals: Dict[str, int], class_id: ClassId) -> Dict[str, int]:
         """Calculate spell costs after intelligence and cost reduction"""
-        base_costs = self.class_base_stats[player_class]['spell_cost_base']
+        base_costs = CLASS_STATS[class_id].spell_costs
         
         # Calculate intelligence bonuses
-        intelligence = 0
-        spell_cost_raw = 0
-        spell_cost_percent = 0
+        intelligence = totals['int']
+        spell_cost_raw = totals['spell_cost_raw']
+        spell_cost_percent = totals['spell_cost_percent']
         
-        for item in items:
-            ids = item.get('identifications', {})
-            intelligence += ids.get('int', 0)
-            spell_cost_raw += ids.get('spell_cost_raw', 0)
-            spell_cost_percent += ids.get('spell_cost_percent', 0)
+        # All four spells at once; the reduction is capped so every cost stays >= 1
+        cost_after_int = base_costs - self._calculate_intelligence_cost_reduction(intelligence, base_costs)
         
-        modified_costs = {}
+        # Apply raw cost reduction
+        cost_after_raw = np.maximum(1, cost_after_int + spell_cost_raw)  # Raw can be negative
         
-        for spell, base_cost in base_costs.items():
-            # Apply intelligence reduction (from reference materials)
-            int_reduction = self._calculate_intelligence_cost_reduction(intelligence, base_cost)
-            cost_after_int = max(1, base_cost - int_reduction)
-            
-            # Apply raw cost reduction
-            cost_after_raw = max(1, cost_after_int + spell_cost_raw)  # Raw can be negative
-            
-            # Apply percentage reduction
-            final_cost = max(1, int(cost_after_raw * (1 - spell_cost_percent / 100)))
-            
-            modified_costs[spell] = final_cost
+        # Apply percentage reduction
+        final_costs = np.maximum(1, (cost_after_raw * (1 - spell_cost_percent / 100)).astype(np.int32))
         
-        return modified_costs
+        return dict(zip(SPELL_KEYS, final_costs.tolist()))
 
-    def _calculate_effective_hp(self, items: List[Dict[str, Any]], player_class: str, player_level: int) -> Dict[str, float]:
-        """Calculate effective HP considering defenses"""
-        health_stats = self._calculate_health(items, player_class, player_level)
+    def _calculate_effective_hp(self, totals: Dict[str, int], class_id: ClassId, player_level: int, *,
+                                health_stats: Optional[Dict[str, int]] = None,
+                                skill_points: Optional[Dict[str, int]] = None) -> Dict[str, float]:
+        """Calculate effective HP considering defenses (reuses health/skill point results when given)"""
+        if health_stats is None:
+            health_stats = self._calculate_health(totals, class_id, player_level)
         total_health = health_stats['total']
         
         # Calculate skill points from items  
-        skill_points = self._calculate_skill_points(items)
+        if skill_points is None:
+            skill_points = self._calculate_skill_points(totals)
         defense_points = skill_points['def']
         agility_points = skill_points['agi']
         
         # Base class defense multiplier
-        base_multiplier = self.class_base_stats[player_class]['base_defense_multiplier']
+        base_multiplier = CLASS_STATS[class_id].defense_mult
         
         # Calculate damage reduction from defense
         defense_reduction = min(0.8, defense_points * 0.003)  # Max 80% reduction
@@ -323,92 +369,49 @@ class WynncraftStatsCalculator:
             'dodge_chance_percent': dodge_chance * 100
         }
 
-    def _get_weapon(self, items: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-        """Get the equipped weapon from items list"""
+    def _get_weapon(self, items: Items) -> Optional[Dict[str, Any]]:
+        """Get the equipped weapon (direct slot lookup for builds keyed by slot)"""
+        if isinstance(items, dict):
+            return items.get('weapon')
+        
         for item in items:
             if item.get('slot') == 'weapon':
                 return item
         return None
 
-    def _calculate_main_attack_dps(self, weapon_damage: Dict[str, List[int]], attack_speed: str) -> float:
+    def _calculate_main_attack_dps(self, weapon: Dict[str, Any]) -> float:
         """Calculate main attack DPS"""
-        if not weapon_damage:
-            return 0.0
-        
-        # Calculate average damage per hit
-        total_damage = 0
-        for damage_type, damage_range in weapon_damage.items():
-            if len(damage_range) == 2:
-                avg_damage = (damage_range[0] + damage_range[1]) / 2
-                total_damage += avg_damage
-        
-        # Get attacks per second
-        attacks_per_second = self.attack_speed_multipliers.get(attack_speed, 2.05)
-        
-        return total_damage * attacks_per_second
+        return main_attack_dps(weapon)
 
-    def _calculate_intelligence_cost_reduction(self, intelligence: int, base_cost: int) -> int:
-        """Calculate mana cost reduction from intelligence (authentic formula)"""
-        if intelligence <= 0:
-            return 0
-        
+    def _calculate_intelligence_cost_reduction(self, intelligence: int, base_cost: np.ndarray) -> np.ndarray:
+        """Calculate mana cost reduction from intelligence (authentic formula), per base cost"""
         # Simplified intelligence formula based on reference materials
-        # Intelligence reduces costs in steps
-        reduction = 0
-        temp_int = intelligence
-        
-        while temp_int >= 2 and reduction < base_cost - 1:
-            reduction += 1
-            temp_int -= 2
-        
-        return min(reduction, base_cost - 1)  # Never reduce below 1 mana
+        # Every 2 intelligence reduces the cost by 1; negative intelligence reduces nothing
+        return np.minimum(max(intelligence, 0) // 2, base_cost - 1)  # Never reduce below 1 mana
 
-    def calculate_build_score(self, items: List[Dict[str, Any]], player_class: str, 
-                            playstyle: str = 'balanced', player_level: int = 106) -> float:
+    def calculate_build_score(self, items: Items, player_class: str, 
+                            playstyle: str = 'balanced', player_level: int = 106,
+                            rows: Optional[List[int]] = None) -> float:
         """
         Calculate overall build effectiveness score (0-100)
         
         Args:
-            items: List of equipped items
+            items: Equipped items, by slot (preferred) or as a list
             player_class: Player's class
             playstyle: Build focus (spellspam, melee, tank, hybrid)
             player_level: Player's level
+            rows: ITEM_STAT_TABLE rows of the items (see calculate_build_stats)
             
         Returns:
             Score from 0 to 100
         """
-        stats = self.calculate_build_stats(items, player_class, player_level)
-        score = 0.0
-        
-        # Base scoring weights by playstyle
-        if playstyle == 'spellspam':
-            weights = {
-                'mana': 0.3,
-                'spell_damage': 0.4,
-                'mana_sustain': 0.2,
-                'survivability': 0.1
-            }
-        elif playstyle == 'melee':
-            weights = {
-                'melee_damage': 0.4,
-                'attack_speed': 0.2,
-                'survivability': 0.3,
-                'utility': 0.1
-            }
-        elif playstyle == 'tank':
-            weights = {
-                'survivability': 0.6,
-                'health': 0.2,
-                'utility': 0.2
-            }
-        else:  # balanced/hybrid
-            weights = {
-                'damage': 0.3,
-                'survivability': 0.3,
-                'mana': 0.2,
-                'utility': 0.2
-            }
+        # With numba installed the whole stat -> score pipeline runs in native code
+        score_build = _load_score_kernel()
+        if score_build is not None:
+            matrix = ITEM_STAT_TABLE[rows] if rows is not None else self._vectorize_items(items)
+            return score_build(matrix, player_class, playstyle, player_level)
         
+        stats = self.calculate_build_stats(items, player_class, player_level, rows=rows)
         # Calculate component scores (0-100 each)
         damage_score = min(100, stats['damage']['main_attack_dps'] / 20)  # Normalized
         health_score = min(100, stats['health']['total'] / 100)  # Normalized
@@ -416,11 +419,49 @@ class WynncraftStatsCalculator:
         ehp_score = min(100, stats['effective_hp']['combined_ehp'] / 150)  # Normalized
         
         # Weight and combine scores
-        final_score = (
-            damage_score * weights.get('damage', 0.25) +
-            health_score * weights.get('health', 0.25) +
-            mana_score * weights.get('mana', 0.25) +
-            ehp_score * weights.get('survivability', 0.25)
-        )
-        
-        return min(100, max(0, final_score))
\ No newline at end of file
+        components = np.array([damage_score, health_score, mana_score, ehp_score], dtype=STAT_DTYPE)
+        final_score = float((components * PLAYSTYLE_WEIGHTS[playstyle_id(playstyle)]).sum())
+        
+        return min(100, max(0, final_score))
+
+    def calculate_build_scores_batch(self, builds_rows: np.ndarray, player_class: str,
+                                     playstyle: str = 'balanced', player_level: int = 106) -> np.ndarray:
+        """
+        Score many builds at once (same formulas as calculate_build_score)
+        
+        Args:
+            builds_rows: (n_builds, len(BUILD_SLOTS)) ITEM_STAT_TABLE row indices,
+                e.g. stacked build_rows() results; empty slots use EMPTY_ROW
+            player_class: Player's class
+            playstyle: Build focus (spellspam, melee, tank, hybrid)
+            player_level: Player's level
+            
+        Returns:
+            (n_builds,) array of scores from 0 to 100
+        """
+        class_stats = CLASS_STATS[CLASS_IDS[player_class]]
+        weights = PLAYSTYLE_WEIGHTS[playstyle_id(playstyle)]
+        
+        # Gather every build's item rows and total them: (n_builds, n_stat_keys)
+        totals = ITEM_STAT_TABLE[builds_rows].sum(axis=1, dtype=STAT_DTYPE)
+        
+        total_health = (class_stats.health * player_level + totals[:, KEY_INDEX['hp']]
+                        + totals[:, KEY_INDEX['health_bonus']])
+        total_mana = class_stats.mana * player_level + totals[:, KEY_INDEX['mana']]
+        
+        # Effective HP, as in _calculate_effective_hp
+        defense_reduction = np.minimum(0.8, totals[:, KEY_INDEX['def']] * 0.003)
+        dodge_chance = np.minimum(0.75, totals[:, KEY_INDEX['agi']] * 0.002)
+        combined_ehp = np.trunc(total_health / np.maximum(
+            0.01, (1 - defense_reduction) * (1 - dodge_chance) * class_stats.defense_mult))
+        
+        # Component scores (0-100 each), weighted and combined
+        components = np.stack([
+            np.minimum(100, totals[:, KEY_INDEX['main_attack_dps']] / 20),
+            np.minimum(100, total_health / 100),
+            np.minimum(100, total_mana / 50),
+            np.minimum(100, combined_ehp / 150)
+        ], axis=1)
+        final_scores = components @ weights
+        
+        return np.clip(final_scores, 0, 100)
\ No newline at end of file
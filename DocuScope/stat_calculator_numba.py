@@ -0,0 +1,67 @@
+"""
+Numba-compiled build scoring kernel
+Native-code port of WynncraftStatsCalculator.calculate_build_score over item stat matrices
+"""
+
+import numpy as np
+from numba import njit
+
+from stat_calculator import KEY_INDEX, CLASS_IDS, CLASS_STATS, STAT_DTYPE, PLAYSTYLE_WEIGHTS, playstyle_id
+
+# Per-class base stats as flat arrays, indexed by ClassId
+CLASS_HEALTH = np.array([stats.health for stats in CLASS_STATS], dtype=STAT_DTYPE)
+CLASS_MANA = np.array([stats.mana for stats in CLASS_STATS], dtype=STAT_DTYPE)
+CLASS_DEFENSE_MULT = np.array([stats.defense_mult for stats in CLASS_STATS], dtype=STAT_DTYPE)
+
+# Stat matrix columns read by the kernel
+_HP = KEY_INDEX['hp']
+_HEALTH_BONUS = KEY_INDEX['health_bonus']
+_MANA = KEY_INDEX['mana']
+_DEF = KEY_INDEX['def']
+_AGI = KEY_INDEX['agi']
+_DPS = KEY_INDEX['main_attack_dps']
+
+# Explicit signature: compiled (or loaded from the on-disk cache) when this module
+# is imported, so the first score call doesn't pay for JIT type inference
+@njit('float32(float32[:,:], int32, int32, int32)', cache=True, fastmath=True, boundscheck=False)
+def compute_build_score(stat_matrix, class_idx, playstyle_idx, level):
+    """Score one build from its (n_items, n_stat_keys) stat matrix"""
+    # Accumulate in the matrix's own (STAT_DTYPE) precision
+    zero = stat_matrix.dtype.type(0)
+    health_bonus = zero
+    mana_bonus = zero
+    defense_points = zero
+    agility_points = zero
+    dps = zero
+    for i in range(stat_matrix.shape[0]):
+        health_bonus += stat_matrix[i, _HP] + stat_matrix[i, _HEALTH_BONUS]
+        mana_bonus += stat_matrix[i, _MANA]
+        defense_points += stat_matrix[i, _DEF]
+        agility_points += stat_matrix[i, _AGI]
+        dps += stat_matrix[i, _DPS]
+    
+    total_health = CLASS_HEALTH[class_idx] * level + health_bonus
+    total_mana = CLASS_MANA[class_idx] * level + mana_bonus
+    
+    # Effective HP from defense reduction and agility dodge
+    defense_reduction = min(0.8, defense_points * 0.003)
+    dodge_chance = min(0.75, agility_points * 0.002)
+    combined_ehp = int(total_health / max(0.01, (1 - defense_reduction) * (1 - dodge_chance)
+                                          * CLASS_DEFENSE_MULT[class_idx]))
+    
+    # Component scores (0-100 each)
+    damage_score = min(100.0, dps / 20)
+    health_score = min(100.0, total_health / 100)
+    mana_score = min(100.0, total_mana / 50)
+    ehp_score = min(100.0, combined_ehp / 150)
+    
+    weights = PLAYSTYLE_WEIGHTS[playstyle_idx]
+    final_score = (damage_score * weights[0] + health_score * weights[1] +
+                   mana_score * weights[2] + ehp_score * weights[3])
+    
+    return min(100.0, max(0.0, final_score))
+
+def score_build(stat_matrix: np.ndarray, player_class: str, playstyle: str, player_level: int) -> float:
+    """Dict-API wrapper: map class/playstyle names to ids and run the kernel"""
+    return float(compute_build_score(stat_matrix, np.int32(CLASS_IDS[player_class]),
+                                     np.int32(playstyle_id(playstyle)), np.int32(player_level)))
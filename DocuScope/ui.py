@@ -14,16 +14,47 @@ from rich.align import Align
 from rich import box
 import os
 
+from core.builder import calculate_build_stats
+
 console = Console()
 
+# Order in which a build's slots are listed
+SLOT_ORDER = ['weapon', 'helmet', 'chestplate', 'leggings', 'boots', 'ring1', 'ring2', 'bracelet', 'necklace']
+
+# Display label for each slot
+SLOT_DISPLAY = {
+    'weapon': 'Weapon',
+    'helmet': 'Helmet',
+    'chestplate': 'Chestplate',
+    'leggings': 'Leggings',
+    'boots': 'Boots',
+    'ring1': 'Ring 1',
+    'ring2': 'Ring 2',
+    'bracelet': 'Bracelet',
+    'necklace': 'Necklace'
+}
+
+# Item name style by rarity (other tiers use 'white')
+TIER_STYLE = {
+    'Mythic': "bold magenta",
+    'Legendary': "bold yellow",
+    'Rare': "bold blue",
+    'Unique': "bold green"
+}
+
 class WynnCLI:
     """Rich-based CLI interface for Wynncraft build tool."""
     
     def __init__(self):
         self.console = console
+        
+        # The static screens never change, so their renderables are built once
+        self._welcome_panel = self._build_welcome_panel()
+        self._main_menu_panel = self._build_main_menu_panel()
+        self._help_layout = self._build_help_layout()
     
-    def show_welcome(self):
-        """Display welcome banner."""
+    def _build_welcome_panel(self):
+        """Build the welcome banner panel."""
         welcome_text = Text()
         welcome_text.append("🏰 ", style="gold1")
         welcome_text.append("WynnBuilder CLI", style="bold cyan")
@@ -31,19 +62,15 @@ class WynnCLI:
         
         subtitle = Text("Advanced Wynncraft Build Generator with AI Assistant", style="dim")
         
-        panel = Panel(
+        return Panel(
             Align.center(welcome_text + "\n" + subtitle),
             box=box.DOUBLE,
             border_style="cyan",
             padding=(1, 2)
         )
-        
-        self.console.print("\n")
-        self.console.print(panel)
-        self.console.print()
     
-    def show_main_menu(self):
-        """Display main menu options."""
+    def _build_main_menu_panel(self):
+        """Build the main menu panel."""
         menu_table = Table(show_header=False, box=box.ROUNDED, border_style="blue")
         menu_table.add_column("Option", style="cyan", width=8)
         menu_table.add_column("Description", style="white")
@@ -54,13 +81,21 @@ class WynnCLI:
         menu_table.add_row("4", "❓ Help")
         menu_table.add_row("5", "🚪 Exit")
         
-        panel = Panel(
+        return Panel(
             menu_table,
             title="[bold blue]Main Menu[/bold blue]",
             border_style="blue"
         )
-        
-        self.console.print(panel)
+    
+    def show_welcome(self):
+        """Display welcome banner."""
+        self.console.print("\n")
+        self.console.print(self._welcome_panel)
+        self.console.print()
+    
+    def show_main_menu(self):
+        """Display main menu options."""
+        self.console.print(self._main_menu_panel)
     
     def get_build_config(self):
         """Get build configuration from user."""
@@ -149,7 +184,6 @@ class WynnCLI:
         
         for i, build in enumerate(builds, 1):
             # Calculate stats
-            from core.builder import calculate_build_stats
             stats = calculate_build_stats(build)
             
             # Create build table
@@ -159,29 +193,17 @@ class WynnCLI:
             build_table.add_column("Type", style="dim", width=10)
             
             # Add items to table
-            slot_order = ['weapon', 'helmet', 'chestplate', 'leggings', 'boots', 'ring1', 'ring2', 'bracelet', 'necklace']
-            
-            for slot in slot_order:
+            for slot in SLOT_ORDER:
                 if slot in build:
                     item = build[slot]
                     item_name = item.get('name', 'Unknown')
                     item_type = item.get('type', '').title()
                     
                     # Color code by rarity
-                    tier = item.get('tier', 'Normal')
-                    if tier == 'Mythic':
-                        item_style = "bold magenta"
-                    elif tier == 'Legendary':
-                        item_style = "bold yellow"
-                    elif tier == 'Rare':
-                        item_style = "bold blue"
-                    elif tier == 'Unique':
-                        item_style = "bold green"
-                    else:
-                        item_style = "white"
+                    item_style = TIER_STYLE.get(item.get('tier', 'Normal'), "white")
                     
                     build_table.add_row(
-                        slot.replace('1', ' 1').replace('2', ' 2').title(),
+                        SLOT_DISPLAY[slot],
                         f"[{item_style}]{item_name}[/{item_style}]",
                         item_type
                     )
@@ -211,8 +233,8 @@ class WynnCLI:
             
             self.console.print(panel)
     
-    def show_help(self):
-        """Display help information."""
+    def _build_help_layout(self):
+        """Build the help screen layout."""
         help_text = Text()
         help_text.append("🎯 ", style="gold1")
         help_text.append("WynnBuilder CLI Help", style="bold cyan")
@@ -254,6 +276,10 @@ class WynnCLI:
             Layout(Panel(tips_text, title="Tips", border_style="green"))
         )
         
-        self.console.print(layout)
+        return layout
+    
+    def show_help(self):
+        """Display help information."""
+        self.console.print(self._help_layout)
         self.console.print("\n[dim]Press Enter to continue...[/dim]")
         input()
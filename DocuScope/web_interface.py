@@ -3,13 +3,24 @@ Web interface for Wynncraft Item Builder CLI Tool
 Flask-based web application providing browser access to build generation
 """
 
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, render_template, request, Response
+from flask.json.provider import JSONProvider
 import json
+import orjson
 import os
 import sys
 from pathlib import Path
 import threading
-import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+import functools
+import logging
+import logging.handlers
+import queue
+import atexit
+import importlib.util
+import subprocess
+from operator import itemgetter
 
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -18,61 +29,286 @@ from core import loader, builder, filters, stats
 from export import export_to_wynnbuilder, export_build_to_text
 from ai_agent import WynnAI
 from rich.console import Console
+from rich.logging import RichHandler
+
+try:
+    from flask_compress import Compress
+except ImportError:  # Optional: responses are sent uncompressed
+    Compress = None
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, so jsonify() serializes in native code"""
+    
+    # numpy arrays/scalars from the stat calculators and int-keyed dicts serialize directly
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.secret_key = os.getenv('FLASK_SECRET_KEY', 'wynnbuilder_secret_key_change_in_production')
 
+# gzip/brotli the JSON and page responses; tiny bodies (e.g. /health) aren't worth compressing
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html']
+app.config['COMPRESS_LEVEL'] = 7
+app.config['COMPRESS_MIN_SIZE'] = 500
+if Compress is not None:
+    Compress(app)
+
 # Initialize components
 console = Console()
+log = logging.getLogger('wynn.web')
+
+def setup_logging():
+    """Send web logs through a queue so request threads never block on terminal output."""
+    if log.handlers:
+        return
+    
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, RichHandler(console=console))
+    listener.start()
+    atexit.register(listener.stop)
+    
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
 ai_agent = WynnAI()
-items_cache = None
-items_cache_time = 0
+# gunicorn workers run in this file's directory, so _run_gunicorn passes them
+# the items.json it found through WYNN_ITEMS_PATH
+items_path = Path(os.environ['WYNN_ITEMS_PATH']) if os.getenv('WYNN_ITEMS_PATH') else None
+_reload_lock = threading.Lock()  # Held only while items.json is being reloaded
+
+# Classes and playstyles offered by the builder form (templates/index.html)
+_WEB_CLASSES = ('mage', 'archer', 'warrior', 'assassin', 'shaman')
+_WEB_PLAYSTYLES = ('spellspam', 'melee', 'hybrid', 'tank')
+_FILTER_CACHE_SIZE = 64
+
+# Edit times of this module and the page template: part of every ETag, so
+# clients revalidating after a deploy don't keep a page or summary from the old code
+_APP_VERSION = '-'.join(
+    str(os.stat(path).st_mtime_ns)
+    for path in (__file__, os.path.join(app.root_path, app.template_folder, 'index.html'))
+)
+
+# /health body before any items are loaded
+_NO_ITEMS_HEALTH_BODY = orjson.dumps({'status': 'healthy', 'items_loaded': False, 'items_count': 0})
+
+@dataclass(frozen=True, eq=False)
+class ItemsSnapshot:
+    """
+    Everything derived from one load of items.json.
+    
+    load_items_cache swaps in a new snapshot as a whole, so a request that reads
+    it once sees items, columns and prebuilt bodies from the same load.
+    """
+    items: List[Dict[str, Any]]
+    columns: Dict[str, Any]  # filters.build_item_columns(items)
+    mtime: float  # items.json mtime when loaded
+    filter_index: Dict[tuple, List[Dict[str, Any]]]  # filter_items result per (class, playstyle, no_mythics) form choice
+    health_body: bytes
+    summary_body: bytes
+    # Filled on first use: filter_items results for other class/playstyle values
+    # sent by API clients (bounded), and rendered pages
+    filter_cache: Dict[tuple, List[Dict[str, Any]]] = field(default_factory=dict)
+    pages: Dict[str, str] = field(default_factory=dict)
+    
+    @property
+    def etag(self) -> str:
+        """ETag for responses that only change when items.json is reloaded (or the app is updated)."""
+        return f'{self.mtime}-{_APP_VERSION}'
+
+items_snapshot = None  # ItemsSnapshot of the loaded items.json
+
+def _build_filter_index(items, columns):
+    """Filter items once for every class/playstyle/mythics choice of the builder form."""
+    index = {}
+    for class_name in _WEB_CLASSES:
+        for playstyle in _WEB_PLAYSTYLES:
+            for no_mythics in (False, True):
+                index[(class_name, playstyle, no_mythics)] = filters.filter_items(
+                    items,
+                    class_filter=class_name,
+                    playstyle_filter=playstyle,
+                    no_mythics=no_mythics,
+                    columns=columns
+                )
+    return index
+
+def _build_snapshot(items, mtime):
+    """Build the ItemsSnapshot for a freshly loaded item list."""
+    columns = filters.build_item_columns(items)
+    return ItemsSnapshot(
+        items=items,
+        columns=columns,
+        mtime=mtime,
+        filter_index=_build_filter_index(items, columns),
+        health_body=orjson.dumps({
+            'status': 'healthy',
+            'items_loaded': True,
+            'items_count': len(items)
+        }),
+        summary_body=orjson.dumps(loader.get_items_summary(items), option=OrjsonProvider.option)
+    )
 
 def load_items_cache():
-    """Load items into cache if not already loaded or if cache is old."""
-    global items_cache, items_cache_time
+    """Current ItemsSnapshot, (re)loading items.json first if it has changed (None if unavailable)."""
+    global items_snapshot, items_path
+    
+    snapshot = items_snapshot
+    
+    if items_path is None:
+        items_path = loader.find_items_file()
     
-    current_time = time.time()
+    # The file's modification time is the cache key: reload only when it changes
+    try:
+        mtime = items_path.stat().st_mtime if items_path is not None else None
+    except OSError:
+        # Moved or deleted; look it up again on the next call
+        items_path = None
+        mtime = None
+    
+    if mtime is None:
+        return snapshot
     
-    # Reload cache every 30 minutes or if not loaded
-    if items_cache is None or (current_time - items_cache_time) > 1800:
-        try:
-            items_data = loader.load_items()
-            if items_data:
-                items_cache = items_data.get('items', [])
-                items_cache_time = current_time
-                return True
-        except Exception as e:
-            console.print(f"[red]Error loading items: {e}[/red]")
-            return False
+    if snapshot is None or mtime != snapshot.mtime:
+        # Readers never lock: rebinding items_snapshot is atomic, so they see
+        # either the old or the new snapshot. The lock just keeps concurrent
+        # requests from reloading at the same time.
+        with _reload_lock:
+            snapshot = items_snapshot
+            if snapshot is not None and mtime == snapshot.mtime:
+                return snapshot
+            try:
+                items_data = loader.load_items(items_path)
+                if items_data:
+                    snapshot = _build_snapshot(items_data.get('items', []), mtime)
+                    items_snapshot = snapshot
+                    _ai_cached.cache_clear()
+            except (OSError, KeyError, ValueError, TypeError):
+                log.exception("Error loading items")
+                return None
     
-    return items_cache is not None
+    return snapshot
+
+_SLOT_ORDER = ('weapon', 'helmet', 'chestplate', 'leggings', 'boots', 'ring1', 'ring2', 'bracelet', 'necklace')
+_SLOT_SET = frozenset(_SLOT_ORDER)
+_ITEM_SUMMARY_KEYS = ('name', 'tier', 'type', 'level')
+_item_summary_values = itemgetter('name', 'tier', 'type', 'lvl')
+
+def _item_summary(item):
+    """Name, tier, type and level of an item for the builds response."""
+    try:
+        return dict(zip(_ITEM_SUMMARY_KEYS, _item_summary_values(item)))
+    except KeyError:
+        # Only 'name' is guaranteed by the loader
+        return {
+            'name': item.get('name', ''),
+            'tier': item.get('tier', 'Normal'),
+            'type': item.get('type', ''),
+            'level': item.get('lvl', 0)
+        }
+
+@functools.lru_cache(maxsize=512)
+def _ai_cached(query_norm, snapshot):
+    """AI answer for a normalized query over the items of an ItemsSnapshot."""
+    return ai_agent.process_query(query_norm, snapshot.items)
+
+def make_json_response(payload, status_code=200):
+    """Build a JSON response straight from orjson bytes (payload may already be serialized)."""
+    body = payload if isinstance(payload, bytes) else orjson.dumps(payload, option=OrjsonProvider.option)
+    return Response(body, status=status_code, mimetype='application/json')
+
+class RequestError(Exception):
+    """Client mistake in an API request; answered with a 400 JSON error."""
+
+@app.errorhandler(RequestError)
+def request_error(error):
+    """400 JSON response for a RequestError."""
+    return make_json_response({'error': str(error)}, 400)
+
+def _json_body():
+    """Parse the request body with orjson into a dict (RequestError if empty, invalid or not an object)"""
+    body = request.get_data(cache=False)
+    if not body:
+        raise RequestError('Empty request body')
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        raise RequestError('Invalid JSON body') from None
+    if not isinstance(data, dict):
+        raise RequestError('Request body must be a JSON object')
+    return data
+
+_NUMBER = (int, float)
+
+def _param(mapping, key, default, types, description, label=None):
+    """mapping[key] (default if missing), RequestError if it is not of the given types."""
+    value = mapping.get(key, default)
+    if not isinstance(value, types):
+        raise RequestError(f"'{label or key}' must be {description}")
+    return value
+
+def _cacheable(response, etag):
+    """Tag a response with its ETag and make clients revalidate it before reuse."""
+    # Weak, since the body may be served gzip/brotli encoded
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'public, max-age=0, must-revalidate'
+    return response
+
+def _not_modified(etag):
+    """304 response if the client already has this version, otherwise None."""
+    if_none_match = request.if_none_match
+    if if_none_match.star_tag:
+        return _cacheable(Response(status=304), etag)
+    # Flask-Compress sends compressed bodies as '<etag>:<encoding>'; clients echo that form
+    for tag in if_none_match.as_set(include_weak=True):
+        if tag.partition(':')[0] == etag:
+            return _cacheable(Response(status=304), tag)
+    return None
 
 @app.route('/')
 def index():
     """Main page."""
-    if not load_items_cache():
+    snapshot = load_items_cache()
+    if snapshot is None:
         return render_template('index.html', error="Could not load item data. Please ensure items.json is available.")
     
-    return render_template('index.html', items_count=len(items_cache) if items_cache else 0)
+    not_modified = _not_modified(snapshot.etag)
+    if not_modified is not None:
+        return not_modified
+    
+    # Only items_count varies, so render once per loaded snapshot
+    html = snapshot.pages.get('index')
+    if html is None:
+        html = render_template('index.html', items_count=len(snapshot.items))
+        snapshot.pages['index'] = html
+    
+    return _cacheable(Response(html, mimetype='text/html'), snapshot.etag)
 
 @app.route('/api/generate_builds', methods=['POST'])
 def api_generate_builds():
     """API endpoint for generating builds."""
+    data = _json_body()
     try:
-        if not load_items_cache():
-            return jsonify({'error': 'Item data not available'}), 500
-        
-        data = request.get_json()
+        snapshot = load_items_cache()
+        if snapshot is None:
+            return make_json_response({'error': 'Item data not available'}, 500)
         
         # Extract parameters
-        class_choice = data.get('class', 'mage')
-        playstyle = data.get('playstyle', 'spellspam')
-        elements = data.get('elements', ['thunder'])
-        no_mythics = data.get('no_mythics', False)
-        min_dps = data.get('min_dps', 0)
-        min_mana = data.get('min_mana', 0)
-        max_cost = data.get('max_cost', 0)
+        class_choice = _param(data, 'class', 'mage', str, 'a string')
+        playstyle = _param(data, 'playstyle', 'spellspam', str, 'a string')
+        elements = _param(data, 'elements', ['thunder'], list, 'a list')
+        if not all(isinstance(element, str) for element in elements):
+            raise RequestError("'elements' must be a list of strings")
+        no_mythics = _param(data, 'no_mythics', False, bool, 'true or false')
+        min_dps = _param(data, 'min_dps', 0, _NUMBER, 'a number')
+        min_mana = _param(data, 'min_mana', 0, _NUMBER, 'a number')
+        max_cost = _param(data, 'max_cost', 0, _NUMBER, 'a number')
         
         # Prepare filters
         build_filters = {
@@ -82,13 +318,24 @@ def api_generate_builds():
             'no_mythics': no_mythics
         }
         
-        # Filter items
-        filtered_items = filters.filter_items(
-            items_cache,
-            class_filter=class_choice,
-            playstyle_filter=playstyle,
-            no_mythics=no_mythics
-        )
+        # Filter items (the result only depends on these flags and the loaded items);
+        # every choice of the builder form was already filtered at load time
+        filter_key = (class_choice, playstyle, bool(no_mythics))
+        filtered_items = snapshot.filter_index.get(filter_key)
+        if filtered_items is None:
+            filtered_items = snapshot.filter_cache.get(filter_key)
+            if filtered_items is None:
+                # Class and playstyle come from the client; keep the cache bounded
+                if len(snapshot.filter_cache) >= _FILTER_CACHE_SIZE:
+                    snapshot.filter_cache.clear()
+                filtered_items = filters.filter_items(
+                    snapshot.items,
+                    class_filter=class_choice,
+                    playstyle_filter=playstyle,
+                    no_mythics=no_mythics,
+                    columns=snapshot.columns
+                )
+                snapshot.filter_cache[filter_key] = filtered_items
         
         # Generate builds
         builds = builder.generate_builds(
@@ -100,10 +347,10 @@ def api_generate_builds():
             max_builds=20  # Limit for web interface
         )
         
-        # Calculate stats for each build
+        # Calculate stats for the top 10 builds (for display) in one batch
+        top_builds = builds[:10]
         build_results = []
-        for i, build in enumerate(builds[:10]):  # Top 10 for display
-            build_stats = builder.calculate_build_stats(build)
+        for i, (build, build_stats) in enumerate(zip(top_builds, builder.calculate_build_stats_batch(top_builds))):
             
             # Format build for JSON response
             build_data = {
@@ -120,80 +367,81 @@ def api_generate_builds():
             }
             
             # Add items with details
-            item_slots = ['weapon', 'helmet', 'chestplate', 'leggings', 'boots', 'ring1', 'ring2', 'bracelet', 'necklace']
-            for slot in item_slots:
-                if slot in build:
-                    item = build[slot]
-                    build_data['items'][slot] = {
-                        'name': item.get('name', ''),
-                        'tier': item.get('tier', 'Normal'),
-                        'type': item.get('type', ''),
-                        'level': item.get('lvl', 0)
-                    }
+            build_data['items'] = {slot: _item_summary(build[slot]) for slot in _SLOT_ORDER if slot in build}
             
             build_results.append(build_data)
         
-        return jsonify({
+        return make_json_response({
             'success': True,
             'builds': build_results,
             'total_found': len(builds)
         })
         
-    except Exception as e:
-        console.print(f"[red]Error generating builds: {e}[/red]")
-        return jsonify({'error': str(e)}), 500
+    except (KeyError, ValueError, TypeError) as e:
+        log.exception("Error generating builds")
+        return make_json_response({'error': str(e)}, 500)
 
 @app.route('/api/ai_query', methods=['POST'])
 def api_ai_query():
     """API endpoint for AI assistant queries."""
+    data = _json_body()
     try:
-        if not load_items_cache():
-            return jsonify({'error': 'Item data not available'}), 500
+        snapshot = load_items_cache()
+        if snapshot is None:
+            return make_json_response({'error': 'Item data not available'}, 500)
         
-        data = request.get_json()
-        query = data.get('query', '')
+        query = _param(data, 'query', '', str, 'a string')
         
         if not query:
-            return jsonify({'error': 'No query provided'}), 400
+            return make_json_response({'error': 'No query provided'}, 400)
         
-        # Process query with AI agent
-        response = ai_agent.process_query(query, items_cache)
+        # Process query with AI agent (repeat queries are answered from the cache)
+        response = _ai_cached(' '.join(query.lower().split()), snapshot)
         
-        return jsonify({
+        return make_json_response({
             'success': True,
             'response': response
         })
         
-    except Exception as e:
-        console.print(f"[red]Error processing AI query: {e}[/red]")
-        return jsonify({'error': str(e)}), 500
+    except (KeyError, ValueError, TypeError) as e:
+        log.exception("Error processing AI query")
+        return make_json_response({'error': str(e)}, 500)
 
 @app.route('/api/export_build', methods=['POST'])
 def api_export_build():
     """API endpoint for exporting builds."""
+    data = _json_body()
     try:
-        data = request.get_json()
         build_data = data.get('build')
         export_format = data.get('format', 'wynnbuilder')
         
         if not build_data:
-            return jsonify({'error': 'No build data provided'}), 400
+            return make_json_response({'error': 'No build data provided'}, 400)
+        if not isinstance(build_data, dict):
+            raise RequestError("'build' must be an object")
+        
+        class_name = _param(build_data, 'class', 'mage', str, 'a string', 'build.class')
+        build_items = _param(build_data, 'items', {}, dict, 'an object', 'build.items')
+        build_stats = _param(build_data, 'stats', {}, dict, 'an object', 'build.stats')
+        for stat in ('dps', 'mana', 'ehp', 'cost'):
+            _param(build_stats, stat, 0, _NUMBER, 'a number', f'build.stats.{stat}')
+        skill_points = _param(build_stats, 'skill_points', {}, dict, 'an object', 'build.stats.skill_points')
+        if not all(isinstance(value, _NUMBER) for value in skill_points.values()):
+            raise RequestError("'build.stats.skill_points' must map to numbers")
         
-        class_name = build_data.get('class', 'mage')
+        # Item names per slot ('' for empty slots)
+        item_names = {}
+        for slot in _SLOT_ORDER:
+            item = _param(build_items, slot, {}, dict, 'an object', f'build.items.{slot}')
+            item_names[slot] = _param(item, 'name', '', str, 'a string', f'build.items.{slot}.name')
         
         # Create build list for export
         build_list = [class_name.title()]
-        item_slots = ['weapon', 'helmet', 'chestplate', 'leggings', 'boots', 'ring1', 'ring2', 'bracelet', 'necklace']
-        
-        for slot in item_slots:
-            item_name = ''
-            if slot in build_data.get('items', {}):
-                item_name = build_data['items'][slot].get('name', '')
-            build_list.append(item_name)
+        build_list.extend(item_names[slot] for slot in _SLOT_ORDER)
         
         if export_format == 'wynnbuilder':
             export_string = export_to_wynnbuilder(build_list)
-            return jsonify({
+            return make_json_response({
                 'success': True,
                 'export_string': export_string,
                 'format': 'wynnbuilder'
@@ -203,51 +451,53 @@ def api_export_build():
             # Create a mock build object for text export
             mock_build = {
                 'class': class_name,
-                **{slot: {'name': build_data['items'].get(slot, {}).get('name', '')} 
-                   for slot in item_slots if slot in build_data.get('items', {})}
+                **{slot: {'name': item_names[slot]}
+                   for slot in build_items.keys() & _SLOT_SET}
             }
             
             text_export = export_build_to_text(
                 mock_build,
-                build_data.get('stats', {}),
+                build_stats,
                 class_name
             )
             
-            return jsonify({
+            return make_json_response({
                 'success': True,
                 'export_text': text_export,
                 'format': 'text'
             })
         
         else:
-            return jsonify({'error': 'Unsupported export format'}), 400
+            return make_json_response({'error': 'Unsupported export format'}, 400)
             
-    except Exception as e:
-        console.print(f"[red]Error exporting build: {e}[/red]")
-        return jsonify({'error': str(e)}), 500
+    except (KeyError, ValueError, TypeError) as e:
+        log.exception("Error exporting build")
+        return make_json_response({'error': str(e)}, 500)
 
 @app.route('/api/items_summary')
 def api_items_summary():
     """API endpoint for items summary."""
     try:
-        if not load_items_cache():
-            return jsonify({'error': 'Item data not available'}), 500
+        snapshot = load_items_cache()
+        if snapshot is None:
+            return make_json_response({'error': 'Item data not available'}, 500)
         
-        summary = loader.get_items_summary(items_cache)
-        return jsonify(summary)
+        not_modified = _not_modified(snapshot.etag)
+        if not_modified is not None:
+            return not_modified
         
-    except Exception as e:
-        console.print(f"[red]Error getting items summary: {e}[/red]")
-        return jsonify({'error': str(e)}), 500
+        # The summary only changes when items.json is reloaded
+        return _cacheable(make_json_response(snapshot.summary_body), snapshot.etag)
+        
+    except (KeyError, ValueError, TypeError) as e:
+        log.exception("Error getting items summary")
+        return make_json_response({'error': str(e)}, 500)
 
 @app.route('/health')
 def health_check():
     """Health check endpoint."""
-    return jsonify({
-        'status': 'healthy',
-        'items_loaded': items_cache is not None,
-        'items_count': len(items_cache) if items_cache else 0
-    })
+    snapshot = items_snapshot
+    return make_json_response(snapshot.health_body if snapshot is not None else _NO_ITEMS_HEALTH_BODY)
 
 @app.errorhandler(404)
 def not_found(error):
@@ -256,18 +506,63 @@ def not_found(error):
 
 @app.errorhandler(500)
 def internal_error(error):
-    """500 error handler."""
+    """500 error handler (a JSON error for API requests)."""
+    if request.path.startswith('/api/'):
+        return make_json_response({'error': 'Internal server error'}, 500)
     return render_template('index.html', error="Internal server error"), 500
 
+def _gunicorn_available():
+    """True if gunicorn and its gevent worker can be used on this platform."""
+    return (
+        os.name == 'posix'
+        and importlib.util.find_spec('gunicorn') is not None
+        and importlib.util.find_spec('gevent') is not None
+    )
+
+def _run_gunicorn(host, port):
+    """Serve the app with gunicorn gevent workers, blocking until gunicorn exits."""
+    # gunicorn runs as a child process, and each worker imports the app itself
+    # after the fork instead of inheriting this process's state. gunicorn_conf.py
+    # has each worker load items.json before it serves requests.
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    command = [
+        sys.executable, '-m', 'gunicorn',
+        '--config', os.path.join(app_dir, 'gunicorn_conf.py'),
+        '--chdir', app_dir,
+        '--bind', f'{host}:{port}',
+        '--workers', str(max(2, os.cpu_count() or 1)),
+        '--worker-class', 'gevent',
+        '--worker-connections', '1000',
+        'web_interface:app'
+    ]
+    # --chdir changes what the relative ITEMS_PATHS point at, so resolve items.json here
+    env = dict(os.environ)
+    found = loader.find_items_file()
+    if found is not None:
+        env['WYNN_ITEMS_PATH'] = str(found.resolve())
+    
+    server = subprocess.Popen(command, env=env)
+    # start_web_server may run on a daemon thread (main.py), so stop gunicorn with the interpreter
+    atexit.register(server.terminate)
+    try:
+        return server.wait()
+    except KeyboardInterrupt:
+        server.terminate()
+        server.wait()
+        raise
+
 def start_web_server():
-    """Start the Flask web server."""
+    """Start the web server (gunicorn if available, the Flask dev server with WYNN_DEV set)."""
     try:
-        # Load items cache on startup
-        if not load_items_cache():
-            console.print("[yellow]Warning: Could not load items on startup[/yellow]")
-        
         console.print("[green]Starting web server on http://0.0.0.0:5000[/green]")
-        app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
+        if os.getenv('WYNN_DEV') or not _gunicorn_available():
+            setup_logging()
+            # Load items cache on startup (gunicorn workers load their own)
+            if load_items_cache() is None:
+                console.print("[yellow]Warning: Could not load items on startup[/yellow]")
+            app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
+        else:
+            _run_gunicorn('0.0.0.0', 5000)
         
     except Exception as e:
         console.print(f"[red]Error starting web server: {e}[/red]")
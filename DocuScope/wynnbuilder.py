@@ -4,7 +4,9 @@ WynnBuilder Launcher - Choose Your Interface
 Provides access to all WynnBuilder interfaces and tools
 """
 
+import importlib
 import sys
+import threading
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
@@ -13,6 +15,25 @@ from prompt_toolkit.styles import Style
 
 console = Console()
 
+# Interface choice -> (module, entry point, startup messages). Classes are
+# instantiated and run(); functions are called.
+_DISPATCH = {
+    'dropdown': ('dropdown_cli', 'DropdownWynnBuilder', ("[cyan]Starting Dropdown Interface...[/cyan]",)),
+    'interactive': ('interactive_cli', 'InteractiveWynnBuilder', ("[cyan]Starting Interactive CLI...[/cyan]",)),
+    'web': ('web_interface', 'start_web_server', (
+        "[cyan]Starting Web Interface on http://localhost:5000...[/cyan]",
+        "[dim]Press Ctrl+C to stop the server[/dim]"
+    )),
+    'extract': ('ability_extractor', 'main', ("[cyan]Starting Ability Extractor...[/cyan]",)),
+}
+
+def _preload(module_name):
+    """Import a module ahead of time; failures are reported when it is imported for real."""
+    try:
+        importlib.import_module(module_name)
+    except Exception:
+        pass
+
 def main():
     """Main launcher with interface selection"""
     console.print("[bold cyan]🏗️  WynnBuilder - Wynncraft Build Generator[/bold cyan]\n")
@@ -47,6 +68,9 @@ def main():
         ('quit', '🚪 Exit')
     ]
     
+    # Import the recommended interface while the user is choosing
+    threading.Thread(target=_preload, args=('dropdown_cli',), daemon=True).start()
+    
     choice = radiolist_dialog(
         title="Choose Interface",
         text="Select how you'd like to use WynnBuilder:",
@@ -59,30 +83,15 @@ def main():
         return 0
     
     try:
-        if choice == 'dropdown':
-            console.print("[cyan]Starting Dropdown Interface...[/cyan]")
-            from dropdown_cli import DropdownWynnBuilder
-            app = DropdownWynnBuilder()
-            return app.run()
-            
-        elif choice == 'interactive':
-            console.print("[cyan]Starting Interactive CLI...[/cyan]")
-            from interactive_cli import InteractiveWynnBuilder
-            app = InteractiveWynnBuilder()
-            return app.run()
-            
-        elif choice == 'web':
-            console.print("[cyan]Starting Web Interface on http://localhost:5000...[/cyan]")
-            console.print("[dim]Press Ctrl+C to stop the server[/dim]")
-            from web_interface import start_web_server
-            start_web_server()
-            return 0
-            
-        elif choice == 'extract':
-            console.print("[cyan]Starting Ability Extractor...[/cyan]")
-            from ability_extractor import main
-            main()
-            return 0
+        module_name, attr, messages = _DISPATCH[choice]
+        for message in messages:
+            console.print(message)
+        
+        entry = getattr(importlib.import_module(module_name), attr)
+        if isinstance(entry, type):
+            return entry().run()
+        entry()
+        return 0
             
     except KeyboardInterrupt:
         console.print("\n[yellow]Operation cancelled.[/yellow]")